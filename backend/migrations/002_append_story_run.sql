@@ -0,0 +1,23 @@
+-- ============================================================================
+-- Migration: append_story_run() for incremental story saves
+-- Description: Appends new events/timeline entries server-side so each
+--              incremental save only ships the tail, not the whole story
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION append_story_run(
+    p_id UUID,
+    p_events JSONB,
+    p_timeline JSONB,
+    p_summary JSONB DEFAULT NULL
+)
+RETURNS VOID
+LANGUAGE sql
+AS $$
+    UPDATE story_runs
+    SET events   = events || COALESCE(p_events, '[]'::jsonb),
+        timeline = timeline || COALESCE(p_timeline, '[]'::jsonb),
+        summary  = COALESCE(p_summary, summary)
+    WHERE id = p_id;
+$$;
+
+COMMENT ON FUNCTION append_story_run(UUID, JSONB, JSONB, JSONB) IS 'Append events/timeline to a story run (used by StoryRunWriter)';
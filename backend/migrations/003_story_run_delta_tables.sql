@@ -0,0 +1,40 @@
+-- ============================================================================
+-- Migration: Delta tables for story run events & timeline
+-- Description: Incremental saves insert one row per new event / timeline
+--              entry instead of rewriting the story_runs JSONB columns
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS story_run_events (
+    run_id UUID NOT NULL REFERENCES story_runs(id) ON DELETE CASCADE,
+    seq INT NOT NULL,
+    data JSONB NOT NULL,
+    PRIMARY KEY (run_id, seq)
+);
+
+CREATE TABLE IF NOT EXISTS story_run_timeline (
+    run_id UUID NOT NULL REFERENCES story_runs(id) ON DELETE CASCADE,
+    seq INT NOT NULL,
+    data JSONB NOT NULL,
+    PRIMARY KEY (run_id, seq)
+);
+
+-- Enable Row Level Security (same open policy as story_runs)
+ALTER TABLE story_run_events ENABLE ROW LEVEL SECURITY;
+ALTER TABLE story_run_timeline ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS "Allow all operations" ON story_run_events;
+CREATE POLICY "Allow all operations"
+ON story_run_events
+FOR ALL
+USING (true)
+WITH CHECK (true);
+
+DROP POLICY IF EXISTS "Allow all operations" ON story_run_timeline;
+CREATE POLICY "Allow all operations"
+ON story_run_timeline
+FOR ALL
+USING (true)
+WITH CHECK (true);
+
+COMMENT ON TABLE story_run_events IS 'Story events of a run, one row per event in write order (seq)';
+COMMENT ON TABLE story_run_timeline IS 'SSE timeline entries of a run, one row per entry in write order (seq)';
@@ -6,7 +6,10 @@ The LLM generates contextual narration; this module validates preconditions,
 enforces max-use limits, and applies world-state updates deterministically.
 """
 
-from typing import Dict, Any, Tuple, List
+import sys
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, Any, FrozenSet, Optional, Tuple, List
 
 
 # ── Generic action catalogue ───────────────────────────────────────────────
@@ -95,8 +98,54 @@ ACTION_DEFINITIONS: Dict[str, Dict[str, Any]] = {
 }
 
 
+# Everything get_allowed_actions() depends on: the world-state fields that
+# preconditions read, and the per-action use caps.
+_PRECONDITION_FIELDS: Tuple[str, ...] = tuple(sorted({
+    field
+    for defn in ACTION_DEFINITIONS.values()
+    for field in defn.get("preconditions", {})
+}))
+_USE_CAPS: Dict[str, int] = {
+    action_type: defn["max_uses"]
+    for action_type, defn in ACTION_DEFINITIONS.items()
+    if defn.get("max_uses", 0) > 0
+}
+
+# Canonical (interned) action-type strings, so every "type" that leaves
+# execute() is the same object as the ACTION_DEFINITIONS key.
+_ACTION_TYPES: Dict[str, str] = {
+    action_type: sys.intern(action_type) for action_type in ACTION_DEFINITIONS
+}
+
+
+@lru_cache(maxsize=128)
+def _allowed_actions_cached(
+    precondition_values: Tuple[Any, ...], exhausted: FrozenSet[str]
+) -> Tuple[str, ...]:
+    """Allowed action types for one (precondition values, exhausted) fingerprint."""
+    world = dict(zip(_PRECONDITION_FIELDS, precondition_values))
+    return tuple(
+        action_type
+        for action_type, defn in ACTION_DEFINITIONS.items()
+        if action_type not in exhausted
+        and all(
+            world.get(field) == required
+            for field, required in defn.get("preconditions", {}).items()
+        )
+    )
+
+
+@lru_cache(maxsize=128)
+def _allowed_set_cached(
+    precondition_values: Tuple[Any, ...], exhausted: FrozenSet[str]
+) -> FrozenSet[str]:
+    """Frozenset view of _allowed_actions_cached() for set operations."""
+    return frozenset(_allowed_actions_cached(precondition_values, exhausted))
+
+
 # ── ActionSystem class ──────────────────────────────────────────────────────
 
+
 class ActionSystem:
     """Validates and deterministically executes character actions."""
 
@@ -108,24 +157,30 @@ class ActionSystem:
 
     @classmethod
     def get_allowed_actions(cls, state) -> List[str]:
-        """Return action types whose preconditions are met and max-use not exceeded."""
-        allowed: List[str] = []
-        world = getattr(state, "world_state", {}) or {}
+        """Return action types whose preconditions are met and max-use not exceeded.
 
-        for action_type, defn in ACTION_DEFINITIONS.items():
-            max_uses = defn.get("max_uses", 0)
-            if max_uses > 0 and cls._action_use_count(state, action_type) >= max_uses:
-                continue
-
-            preconds = defn.get("preconditions", {})
-            ok = True
-            for field, required in preconds.items():
-                if world.get(field) != required:
-                    ok = False
-                    break
-            if ok:
-                allowed.append(action_type)
-        return allowed
+        The answer only depends on the precondition fields of world_state and
+        on which capped actions are used up, so it is memoised on that
+        fingerprint — repeated calls within a turn hit the cache.
+        """
+        return list(_allowed_actions_cached(*cls._fingerprint(state)))
+
+    @classmethod
+    def get_allowed_action_set(cls, state) -> FrozenSet[str]:
+        """Like get_allowed_actions(), as a shared (memoised) frozenset."""
+        return _allowed_set_cached(*cls._fingerprint(state))
+
+    @staticmethod
+    def _fingerprint(state) -> Tuple[Tuple[Any, ...], FrozenSet[str]]:
+        """(precondition values, exhausted capped actions) for *state*."""
+        world = getattr(state, "world_state", {}) or {}
+        counts = Counter(getattr(state, "actions_taken", None) or [])
+        exhausted = frozenset(
+            action_type
+            for action_type, cap in _USE_CAPS.items()
+            if counts[action_type] >= cap
+        )
+        return tuple(world.get(f) for f in _PRECONDITION_FIELDS), exhausted
 
     @staticmethod
     def get_action_descriptions() -> Dict[str, str]:
@@ -134,23 +189,27 @@ class ActionSystem:
 
     def execute(
         self, action: Dict[str, Any], state, actor: str
-    ) -> Tuple[bool, Dict[str, Any], str]:
+    ) -> Tuple[bool, Dict[str, Any], str, Optional[str]]:
         """
         Validate and execute *action* proposed by *actor*.
 
         The LLM provides narration via action.params.narration.
         This method only validates preconditions and updates world_state.
 
-        Returns (success, state_updates_dict, narration_text)
+        Returns (success, state_updates_dict, narration_text, action_type),
+        where *action_type* is the canonical (interned) type, or None when
+        the type is unknown.  *action* itself is left unchanged.
         """
-        action_type = (action.get("type") or "").upper()
+        raw_type = (action.get("type") or "").upper()
         params = action.get("params") or {}
 
-        if action_type not in ACTION_DEFINITIONS:
+        action_type = _ACTION_TYPES.get(raw_type)
+        if action_type is None:
             return (
                 False,
                 {},
-                f"{actor} attempted an unknown action '{action_type}'.",
+                f"{actor} attempted an unknown action '{raw_type}'.",
+                None,
             )
 
         defn = ACTION_DEFINITIONS[action_type]
@@ -163,6 +222,7 @@ class ActionSystem:
                 {},
                 f"{actor} tried to {defn['description'].lower()} but "
                 f"it has already been done the maximum number of times.",
+                action_type,
             )
 
         # ── check preconditions against world_state ─────────────────────
@@ -174,6 +234,7 @@ class ActionSystem:
                     {},
                     f"{actor} tried to {defn['description'].lower()} but "
                     f"conditions were not met.",
+                    action_type,
                 )
 
         # ── narration (LLM-provided or generic fallback) ───────────────
@@ -189,4 +250,4 @@ class ActionSystem:
         if action_type == "EXIT_SCENE":
             world_updates[f"{actor}_departed"] = True
 
-        return True, {"world_state": world_updates}, narration
+        return True, {"world_state": world_updates}, narration, action_type
@@ -18,17 +18,24 @@ class BaseAgent(ABC):
             max_tokens=config.max_tokens_per_prompt,
         )
 
-    async def generate_response(self, prompt: str) -> str:
-        """Generate a response using the failover LLM provider."""
+    async def generate_response(self, prompt: str, system: Optional[str] = None) -> str:
+        """Generate a response using the failover LLM provider.
+
+        *system* is the static, cacheable part of the prompt (see
+        ``LLMProvider.generate``); *prompt* carries the per-turn content.
+        """
+        logged_prompt = f"{system}\n\n{prompt}" if system else prompt
         try:
-            response_content, provider_used = await self._llm_provider.generate(prompt)
-            self._log_interaction(prompt, response_content, provider_used)
+            response_content, provider_used = await self._llm_provider.generate(
+                prompt, system=system
+            )
+            self._log_interaction(logged_prompt, response_content, provider_used)
             if not response_content or not response_content.strip():
                 print(f"[{self.name}] LLM returned empty content via {provider_used}")
             return response_content
         except Exception as e:
             print(f"[{self.name}] LLM call failed: {e}")
-            self._log_interaction(prompt, f"[ERROR] {e}", "failed")
+            self._log_interaction(logged_prompt, f"[ERROR] {e}", "failed")
             return ""
 
     def _log_interaction(self, prompt: str, response: str, provider: str = "unknown"):
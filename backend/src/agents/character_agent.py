@@ -7,6 +7,53 @@ from ..action_system import ACTION_DEFINITIONS
 from ..prompts.character_prompts import build_character_context_pack
 
 
+# Invalid action keyword → closest allowed action type
+_KEYWORD_MAP = {
+    "CHECK": "INVESTIGATE",
+    "EXAMINE": "INVESTIGATE",
+    "INSPECT": "INVESTIGATE",
+    "LOOK": "INVESTIGATE",
+    "ASSESS": "INVESTIGATE",
+    "SEARCH": "INVESTIGATE",
+    "CALL": "SUMMON_HELP",
+    "PHONE": "SUMMON_HELP",
+    "HELP": "SUMMON_HELP",
+    "BARGAIN": "NEGOTIATE",
+    "DEAL": "NEGOTIATE",
+    "OFFER": "NEGOTIATE",
+    "PROPOSE": "NEGOTIATE",
+    "COMPROMISE": "NEGOTIATE",
+    "AGREE": "ACCEPT_TERMS",
+    "ACCEPT": "ACCEPT_TERMS",
+    "FIGHT": "CONFRONT",
+    "CHALLENGE": "CONFRONT",
+    "APPROACH": "CONFRONT",
+    "THREATEN": "CONFRONT",
+    "SHOW": "PRESENT_EVIDENCE",
+    "REVEAL": "PRESENT_EVIDENCE",
+    "PROVE": "PRESENT_EVIDENCE",
+    "DISPLAY": "PRESENT_EVIDENCE",
+    "MEDIATE": "INTERVENE",
+    "STOP": "INTERVENE",
+    "BREAK": "INTERVENE",
+    "SEPARATE": "INTERVENE",
+    "CALM": "INTERVENE",
+    "LEAVE": "EXIT_SCENE",
+    "DEPART": "EXIT_SCENE",
+    "WALK": "EXIT_SCENE",
+    "GO": "EXIT_SCENE",
+    "FLEE": "EXIT_SCENE",
+    "RUN": "EXIT_SCENE",
+    "PAY": "MAKE_PAYMENT",
+    "MONEY": "MAKE_PAYMENT",
+    "BRIBE": "MAKE_PAYMENT",
+    "COMPENSATE": "MAKE_PAYMENT",
+    "ACT": "TAKE_DECISIVE_ACTION",
+    "DECIDE": "TAKE_DECISIVE_ACTION",
+    "BOLD": "TAKE_DECISIVE_ACTION",
+}
+
+
 class CharacterAgent(BaseAgent):
     def __init__(self, name: str, config: StoryConfig):
         super().__init__(name, config)
@@ -21,6 +68,7 @@ class CharacterAgent(BaseAgent):
         memories: List[str],
         allowed_actions: List[str],
         force_act: bool = False,
+        suggested_action: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Character decides TALK vs ACT.  Includes:
@@ -31,7 +79,7 @@ class CharacterAgent(BaseAgent):
         """
         character_profile = story_state.character_profiles.get(self.name)
 
-        prompt = build_character_context_pack(
+        prefix, prompt = build_character_context_pack(
             character_name=self.name,
             character_profile=character_profile,
             story_state=story_state,
@@ -39,10 +87,11 @@ class CharacterAgent(BaseAgent):
             allowed_actions=allowed_actions,
             force_act=force_act,
             config=self.config,
+            suggested_action=suggested_action,
         )
 
         try:
-            content = await self.generate_response(prompt)
+            content = await self.generate_response(prompt, system=prefix)
 
             if content and content.strip():
                 decision = self._parse_decision(content, allowed_actions)
@@ -135,7 +184,7 @@ class CharacterAgent(BaseAgent):
     ) -> Optional[str]:
         if not allowed_actions:
             return None
-        used = set(story_state.actions_taken)
+        used = story_state.distinct_actions
         unused = [a for a in allowed_actions if a not in used]
         return unused[0] if unused else allowed_actions[0]
 
@@ -291,50 +340,6 @@ class CharacterAgent(BaseAgent):
                 return allowed
 
         # Keyword mapping
-        _KEYWORD_MAP = {
-            "CHECK": "INVESTIGATE",
-            "EXAMINE": "INVESTIGATE",
-            "INSPECT": "INVESTIGATE",
-            "LOOK": "INVESTIGATE",
-            "ASSESS": "INVESTIGATE",
-            "SEARCH": "INVESTIGATE",
-            "CALL": "SUMMON_HELP",
-            "PHONE": "SUMMON_HELP",
-            "HELP": "SUMMON_HELP",
-            "BARGAIN": "NEGOTIATE",
-            "DEAL": "NEGOTIATE",
-            "OFFER": "NEGOTIATE",
-            "PROPOSE": "NEGOTIATE",
-            "COMPROMISE": "NEGOTIATE",
-            "AGREE": "ACCEPT_TERMS",
-            "ACCEPT": "ACCEPT_TERMS",
-            "FIGHT": "CONFRONT",
-            "CHALLENGE": "CONFRONT",
-            "APPROACH": "CONFRONT",
-            "THREATEN": "CONFRONT",
-            "SHOW": "PRESENT_EVIDENCE",
-            "REVEAL": "PRESENT_EVIDENCE",
-            "PROVE": "PRESENT_EVIDENCE",
-            "DISPLAY": "PRESENT_EVIDENCE",
-            "MEDIATE": "INTERVENE",
-            "STOP": "INTERVENE",
-            "BREAK": "INTERVENE",
-            "SEPARATE": "INTERVENE",
-            "CALM": "INTERVENE",
-            "LEAVE": "EXIT_SCENE",
-            "DEPART": "EXIT_SCENE",
-            "WALK": "EXIT_SCENE",
-            "GO": "EXIT_SCENE",
-            "FLEE": "EXIT_SCENE",
-            "RUN": "EXIT_SCENE",
-            "PAY": "MAKE_PAYMENT",
-            "MONEY": "MAKE_PAYMENT",
-            "BRIBE": "MAKE_PAYMENT",
-            "COMPENSATE": "MAKE_PAYMENT",
-            "ACT": "TAKE_DECISIVE_ACTION",
-            "DECIDE": "TAKE_DECISIVE_ACTION",
-            "BOLD": "TAKE_DECISIVE_ACTION",
-        }
         for keyword, mapped in _KEYWORD_MAP.items():
             if keyword in at and mapped in allowed_actions:
                 return mapped
@@ -8,12 +8,15 @@ from ..prompts.director_prompts import (
     build_arc_planning_prompt,
     build_director_select_prompt,
     build_director_conclusion_prompt,
+    build_director_turn_prompt,
     build_final_conclusion_narration_prompt,
     ALLOWED_ACTIONS,
 )
+from ..prompts.phases import story_phase
 
 
-def _get_phase(current_turn: int, total_turns: int) -> str:
+def _narration_phase(current_turn: int, total_turns: int) -> str:
+    """Coarse setup / conflict / resolution split for the fallback narration."""
     if total_turns <= 0:
         return "setup"
     progress = current_turn / total_turns
@@ -133,14 +136,7 @@ class DirectorAgent(BaseAgent):
         action_idx = 0
         for i in range(1, total_turns):
             speaker = char_names[i % len(char_names)] if char_names else None
-            if i < total_turns * 0.15:
-                phase = "setup"
-            elif i < total_turns * 0.55:
-                phase = "conflict"
-            elif i < total_turns * 0.80:
-                phase = "climax"
-            else:
-                phase = "resolution"
+            phase = story_phase(i, total_turns).lower()
 
             beat_type = "dialogue"
             beat_text = "Story continues"
@@ -164,14 +160,10 @@ class DirectorAgent(BaseAgent):
     #  SPEAKER SELECTION (hybrid: rules + LLM)
     # ════════════════════════════════════════════════════════════════
 
-    async def select_next_speaker(
-        self,
-        story_state: StoryState,
-        available_characters: List[str],
-        force_act: bool = False,
-        endgame: bool = False,
-    ) -> Tuple[str, str]:
-        # ── deterministic guard: no repeat speaker ──────────────────
+    def _filter_repeat_speaker(
+        self, story_state: StoryState, available_characters: List[str]
+    ) -> List[str]:
+        """Deterministic guard: drop the last speaker after too long a run."""
         filtered = available_characters.copy()
         if story_state.dialogue_history:
             last_speaker = story_state.dialogue_history[-1].speaker
@@ -187,17 +179,37 @@ class DirectorAgent(BaseAgent):
                 ]
                 if not filtered:
                     filtered = available_characters
+        return filtered
+
+    @staticmethod
+    def _match_speaker(speaker: str, filtered: List[str]) -> str:
+        """Map the LLM's speaker choice onto the filtered list (fuzzy)."""
+        if speaker in filtered:
+            return speaker
+        for c in filtered:
+            if c.lower() in speaker.lower() or speaker.lower() in c.lower():
+                return c
+        return filtered[0]
+
+    async def select_next_speaker(
+        self,
+        story_state: StoryState,
+        available_characters: List[str],
+        force_act: bool = False,
+        endgame: bool = False,
+    ) -> Tuple[str, str]:
+        # ── deterministic guard: no repeat speaker ──────────────────
+        filtered = self._filter_repeat_speaker(story_state, available_characters)
 
         # ── LLM speaker selection ───────────────────────────────────
-        prompt = build_director_select_prompt(
+        prefix, prompt = build_director_select_prompt(
             story_state=story_state,
             available_characters=filtered,
             force_act=force_act,
             endgame=endgame,
-            config=self.config,
         )
 
-        response = await self.generate_response(prompt)
+        response = await self.generate_response(prompt, system=prefix)
 
         if not response or not response.strip():
             print("[Director] Empty speaker response, using fallback")
@@ -211,13 +223,7 @@ class DirectorAgent(BaseAgent):
         if data:
             speaker = data.get("next_speaker", "")
             narration = data.get("narration", "")
-            if speaker in filtered:
-                return speaker, narration
-            # fuzzy match
-            for c in filtered:
-                if c.lower() in speaker.lower() or speaker.lower() in c.lower():
-                    return c, narration
-            return filtered[0], narration
+            return self._match_speaker(speaker, filtered), narration
 
         # Attempt 2: repair
         print("[Director] Speaker parse failed, attempting repair…")
@@ -237,17 +243,28 @@ class DirectorAgent(BaseAgent):
             self._fallback_narration(story_state),
         )
 
+    def likely_speaker(
+        self, story_state: StoryState, available_characters: List[str]
+    ) -> str:
+        """Cheap guess at select_next_speaker's pick, without an LLM call.
+
+        Same rule as the fallback: the planned beat's speaker, else rotation
+        over the characters the repeat-speaker guard allows.
+        """
+        return self._fallback_speaker(
+            story_state, self._filter_repeat_speaker(story_state, available_characters)
+        )
+
     # ── Fallback helpers ────────────────────────────────────────────
 
     def _fallback_speaker(
         self, story_state: StoryState, available: List[str]
     ) -> str:
-        arc_plan = getattr(story_state, "story_arc_plan", [])
-        for beat in arc_plan:
-            if beat.get("turn") == story_state.current_turn:
-                suggested = beat.get("suggested_speaker")
-                if suggested and suggested in available:
-                    return suggested
+        beat = story_state.arc_beat(story_state.current_turn)
+        if beat is not None:
+            suggested = beat.get("suggested_speaker")
+            if suggested and suggested in available:
+                return suggested
         if available:
             return available[story_state.current_turn % len(available)]
         return "Unknown"
@@ -258,12 +275,11 @@ class DirectorAgent(BaseAgent):
         turn = story_state.current_turn
         total = story_state.total_turns or 25
 
-        arc_plan = getattr(story_state, "story_arc_plan", [])
-        for beat in arc_plan:
-            if beat.get("turn") == turn:
-                bt = beat.get("beat", "")
-                if bt:
-                    return bt
+        beat = story_state.arc_beat(turn)
+        if beat is not None:
+            bt = beat.get("beat", "")
+            if bt:
+                return bt
 
         # Gather context for richer fallback
         chars = list((story_state.character_profiles or {}).keys())
@@ -273,7 +289,7 @@ class DirectorAgent(BaseAgent):
             else None
         )
 
-        phase = _get_phase(turn, total)
+        phase = _narration_phase(turn, total)
         # Rotate through varied fallbacks using turn number
         if phase == "setup":
             if turn == 0:
@@ -308,12 +324,9 @@ class DirectorAgent(BaseAgent):
     async def check_conclusion(
         self, story_state: StoryState
     ) -> Tuple[bool, Optional[str]]:
-        prompt = build_director_conclusion_prompt(
-            story_state=story_state,
-            config=self.config,
-        )
+        prefix, prompt = build_director_conclusion_prompt(story_state=story_state)
 
-        response = await self.generate_response(prompt)
+        response = await self.generate_response(prompt, system=prefix)
 
         if not response or not response.strip():
             return False, None
@@ -336,6 +349,69 @@ class DirectorAgent(BaseAgent):
         print("[Director] Conclusion repair failed, defaulting to continue")
         return False, None
 
+    # ════════════════════════════════════════════════════════════════
+    #  COMBINED TURN PLAN (conclusion check + next speaker)
+    # ════════════════════════════════════════════════════════════════
+
+    async def plan_turn(
+        self,
+        story_state: StoryState,
+        available_characters: List[str],
+        force_act: bool = False,
+        endgame: bool = False,
+    ) -> Dict[str, Any]:
+        """Answer the conclusion check and pick the next speaker in one call.
+
+        Returns ``{"should_end", "conclusion_narration", "next_speaker",
+        "narration"}``.  ``next_speaker`` is None when the story ends or the
+        selection could not be parsed — callers then fall back to
+        ``select_next_speaker``.
+        """
+        filtered = self._filter_repeat_speaker(story_state, available_characters)
+        prefix, prompt = build_director_turn_prompt(
+            story_state=story_state,
+            available_characters=filtered,
+            force_act=force_act,
+            endgame=endgame,
+        )
+
+        response = await self.generate_response(prompt, system=prefix)
+
+        plan: Dict[str, Any] = {
+            "should_end": False,
+            "conclusion_narration": None,
+            "next_speaker": None,
+            "narration": "",
+        }
+        if not response or not response.strip():
+            return plan
+
+        # Attempt 1: safe parse
+        data = self.safe_parse_json(response)
+        if not data:
+            # Attempt 2: repair
+            print("[Director] Turn plan parse failed, attempting repair…")
+            schema = (
+                '{"conclusion": {"should_end": false, "reason": "...", '
+                '"conclusion_narration": null}, '
+                '"select": {"next_speaker": "Character Name", "narration": "..."}}'
+            )
+            data = await self._repair_json(response, schema)
+        if not data:
+            print("[Director] Turn plan repair failed, defaulting to continue")
+            return plan
+
+        conclusion = data.get("conclusion") or {}
+        plan["should_end"] = bool(conclusion.get("should_end", False))
+        plan["conclusion_narration"] = conclusion.get("conclusion_narration")
+
+        select = data.get("select") or {}
+        speaker = select.get("next_speaker")
+        if not plan["should_end"] and speaker and filtered:
+            plan["next_speaker"] = self._match_speaker(str(speaker), filtered)
+            plan["narration"] = select.get("narration", "")
+        return plan
+
     # ════════════════════════════════════════════════════════════════
     #  FINAL CONCLUSION NARRATION
     # ════════════════════════════════════════════════════════════════
@@ -344,10 +420,7 @@ class DirectorAgent(BaseAgent):
         self, story_state: StoryState
     ) -> str:
         """Generate a cinematic conclusion narration that wraps up the story."""
-        prompt = build_final_conclusion_narration_prompt(
-            story_state=story_state,
-            config=self.config,
-        )
+        prompt = build_final_conclusion_narration_prompt(story_state=story_state)
 
         response = await self.generate_response(prompt)
 
@@ -379,7 +452,7 @@ class DirectorAgent(BaseAgent):
         title = seed.get("title", "Untitled")
         chars = list((story_state.character_profiles or {}).keys())
         char_text = " and ".join(chars) if chars else "The characters"
-        actions = list(set(story_state.actions_taken))
+        actions = story_state.distinct_actions_sorted
 
         if actions:
             return (
@@ -6,12 +6,14 @@ Endpoints:
 """
 
 import asyncio
+import heapq
 import json
 import sys
 import os
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
@@ -29,10 +31,10 @@ from src.schemas import StoryState, CharacterProfile, CharacterMemory, DialogueT
 from src.agents.character_agent import CharacterAgent
 from src.agents.director_agent import DirectorAgent
 from src.action_system import ActionSystem
-from src.action_system import RESOLUTION_SIGNALS
+from src.json_utils import dump_pretty, dump_line
 from src.supabase_client import (
     save_story_run, list_story_runs, get_story_run, delete_story_run,
-    create_story_run, update_story_run,
+    create_story_run, StoryRunWriter, drain_persistence, close_http,
 )
 
 app = FastAPI(title="NarrativeVerse API")
@@ -45,6 +47,13 @@ app.add_middleware(
 )
 
 
+@app.on_event("shutdown")
+async def _flush_pending_saves():
+    """Let queued Supabase writes finish, then close the pooled client."""
+    await drain_persistence()
+    await close_http()
+
+
 # ── Request schemas ─────────────────────────────────────────────────────
 
 class CharacterInput(BaseModel):
@@ -73,12 +82,55 @@ def _sse(event: str, data: dict) -> str:
 
 def _pick_suggested_action(state: StoryState, action_system: ActionSystem):
     """Pick any unused+allowed action for the current story."""
-    used = set(state.actions_taken)
-    allowed = set(action_system.get_allowed_actions(state))
-    candidates = allowed - used
+    allowed = action_system.get_allowed_action_set(state)
+    candidates = allowed.difference(state.distinct_actions)
     if not candidates:
         return None
-    return sorted(candidates)[0]
+    return min(candidates)
+
+
+def _turn_pacing(
+    state: StoryState,
+    config: StoryConfig,
+    min_actions: int,
+    action_system: ActionSystem,
+) -> Tuple[bool, bool, Optional[str]]:
+    """Deterministic pacing rules for the turn about to start.
+
+    Returns (force_act, endgame, suggested_action).
+    """
+    total_turns = config.max_turns
+    turn_num = state.current_turn
+    distinct_actions = len(state.distinct_actions)
+    remaining = total_turns - turn_num
+    force_act = False
+    suggested_action = None
+
+    actions_needed = min_actions - distinct_actions
+    if actions_needed > 0 and remaining <= actions_needed + 1:
+        force_act = True
+    if state.turns_since_state_change >= 2:
+        force_act = True
+    # Mid-story action pressure
+    mid_point = max(3, total_turns // 2)
+    if turn_num >= mid_point and distinct_actions < max(1, min_actions // 2):
+        force_act = True
+    # Late-game action pressure
+    late_point = max(4, int(total_turns * 0.7))
+    if turn_num >= late_point and distinct_actions < min_actions:
+        force_act = True
+
+    endgame = remaining <= max(2, int(total_turns * 0.2))
+
+    # Endgame resolution push: force resolution-oriented actions
+    if endgame:
+        if not state.has_resolution:
+            force_act = True
+
+    if force_act and distinct_actions < min_actions:
+        suggested_action = _pick_suggested_action(state, action_system)
+
+    return force_act, endgame, suggested_action
 
 
 # ── Main generation endpoint ────────────────────────────────────────────
@@ -88,10 +140,12 @@ async def generate_story(req: GenerateRequest):
     """Stream the narrative generation step-by-step via SSE."""
 
     async def event_stream():
-        config = StoryConfig()
-        config.max_turns = req.max_turns
-        config.min_turns = req.min_turns
-        config.min_actions = req.min_actions
+        # Scale min_actions proportionally: ~20% of total turns
+        config = StoryConfig(
+            max_turns=req.max_turns,
+            min_turns=req.min_turns,
+            min_actions=max(3, req.max_turns // 5),
+        )
 
         seed_story = {"title": req.title, "description": req.description}
 
@@ -121,9 +175,7 @@ async def generate_story(req: GenerateRequest):
         }
 
         total_turns = config.max_turns
-        # Scale min_actions proportionally: ~20% of total turns
-        min_actions = max(3, total_turns // 5)
-        config.min_actions = min_actions
+        min_actions = config.min_actions
 
         state = StoryState(
             seed_story=seed_story,
@@ -167,10 +219,15 @@ async def generate_story(req: GenerateRequest):
                 print(f"[Supabase] Story run created: {current_run_id}")
         except Exception as e:
             print(f"[Supabase] Failed to create story run: {e}")
+        run_writer = StoryRunWriter(current_run_id) if current_run_id else None
+
+        # Combined conclusion + next-speaker answer, carried into next turn
+        turn_plan: Optional[Dict[str, Any]] = None
 
         # ── Main loop ──────────────────────────────────────────────────
         while not state.is_concluded and state.current_turn < config.max_turns:
             turn_num = state.current_turn
+            state.turn_started_at = datetime.now()
 
             # ── 1) Director Select ─────────────────────────────────────
             yield _sse("step", {"phase": "director_select", "turn": turn_num})
@@ -196,36 +253,10 @@ async def generate_story(req: GenerateRequest):
                 break
 
             # Determine force_act / endgame
-            distinct_actions = len(set(state.actions_taken))
-            remaining = config.max_turns - turn_num
-            force_act = False
-            suggested_action = None
-
-            actions_needed = min_actions - distinct_actions
-            if actions_needed > 0 and remaining <= actions_needed + 1:
-                force_act = True
-            if state.turns_since_state_change >= 2:
-                force_act = True
-            # Mid-story action pressure
-            mid_point = max(3, total_turns // 2)
-            if turn_num >= mid_point and distinct_actions < max(1, min_actions // 2):
-                force_act = True
-            # Late-game action pressure
-            late_point = max(4, int(total_turns * 0.7))
-            if turn_num >= late_point and distinct_actions < min_actions:
-                force_act = True
-
-            endgame = remaining <= max(2, int(total_turns * 0.2))
-
-            # Endgame resolution push: force resolution-oriented actions
-            if endgame:
-                world = state.world_state or {}
-                has_resolution = any(world.get(k) for k in RESOLUTION_SIGNALS)
-                if not has_resolution:
-                    force_act = True
-
-            if force_act and distinct_actions < min_actions:
-                suggested_action = _pick_suggested_action(state, action_system)
+            distinct_actions = len(state.distinct_actions)
+            force_act, endgame, suggested_action = _turn_pacing(
+                state, config, min_actions, action_system
+            )
 
             # LLM speaker selection
             available = list(characters_agents.keys())
@@ -236,9 +267,14 @@ async def generate_story(req: GenerateRequest):
                 if run >= config.max_consecutive_same_character:
                     filtered = [c for c in available if c != last_speaker] or available
 
-            next_speaker, narration = await director.select_next_speaker(
-                state, filtered, force_act=force_act, endgame=endgame
-            )
+            if turn_plan and turn_plan["next_speaker"] in filtered:
+                # Already chosen by last turn's combined conclusion/select call
+                next_speaker, narration = turn_plan["next_speaker"], turn_plan["narration"]
+            else:
+                next_speaker, narration = await director.select_next_speaker(
+                    state, filtered, force_act=force_act, endgame=endgame
+                )
+            turn_plan = None
 
             state.next_speaker = next_speaker
             state.force_act = force_act
@@ -265,11 +301,8 @@ async def generate_story(req: GenerateRequest):
             })
 
             # ── Incremental save after director result ─────────────────
-            if current_run_id:
-                try:
-                    await update_story_run(current_run_id, state.events, sse_timeline)
-                except Exception as e:
-                    print(f"[Supabase] Incremental save failed: {e}")
+            if run_writer:
+                await run_writer.update(state.events, sse_timeline)
 
             # ── 2) Character Reason ────────────────────────────────────
             yield _sse("step", {"phase": "character_reason", "turn": turn_num})
@@ -318,11 +351,13 @@ async def generate_story(req: GenerateRequest):
 
             if actual_mode == "ACT" and decision.get("action"):
                 action = decision["action"]
-                success, effects, act_narration = action_system.execute(action, state, next_speaker)
+                success, effects, act_narration, action_type = action_system.execute(
+                    action, state, next_speaker
+                )
 
                 if success:
                     state.current_turn += 1
-                    state.actions_taken.append(action["type"])
+                    state.add_action(action_type)
                     state.turns_since_state_change = 0
                     state.force_act = False
                     state.suggested_action = None
@@ -336,19 +371,20 @@ async def generate_story(req: GenerateRequest):
                         "type": "action", "content": act_narration,
                         "speaker": next_speaker,
                         "turn": state.current_turn,
-                        "metadata": {"action": {"type": action["type"], "actor": next_speaker}},
+                        "metadata": {"action": {"type": action_type, "actor": next_speaker}},
                     }
                     state.events.append(new_event)
-                    state.dialogue_history.append(DialogueTurn(
+                    state.dialogue_history.append(DialogueTurn.model_construct(
                         turn_number=state.current_turn, speaker=next_speaker,
-                        dialogue=f"[ACTION: {action['type']}] {act_narration}",
-                        metadata={"action_type": action["type"]},
+                        dialogue=f"[ACTION: {action_type}] {act_narration}",
+                        timestamp=state.turn_started_at,
+                        metadata={"action_type": action_type},
                     ))
 
                     event_data = {
                         "type": "action", "turn": state.current_turn,
                         "speaker": next_speaker,
-                        "actionType": action["type"],
+                        "actionType": action_type,
                         "content": act_narration,
                         "emotion": decision.get("emotion", "neutral"),
                         "observation": decision.get("observation", ""),
@@ -362,8 +398,9 @@ async def generate_story(req: GenerateRequest):
             if actual_mode == "TALK" or event_data is None:
                 speech = decision.get("speech") or "…"
                 state.current_turn += 1
-                state.dialogue_history.append(DialogueTurn(
+                state.dialogue_history.append(DialogueTurn.model_construct(
                     turn_number=state.current_turn, speaker=next_speaker, dialogue=speech,
+                    timestamp=state.turn_started_at,
                 ))
                 state.events.append({
                     "type": "dialogue", "speaker": next_speaker,
@@ -385,11 +422,8 @@ async def generate_story(req: GenerateRequest):
             _track("action_result", event_data)
 
             # ── Incremental save after character action/dialogue ───────
-            if current_run_id:
-                try:
-                    await update_story_run(current_run_id, state.events, sse_timeline)
-                except Exception as e:
-                    print(f"[Supabase] Incremental save failed: {e}")
+            if run_writer:
+                await run_writer.update(state.events, sse_timeline)
 
             # ── 4) Memory Update (with information asymmetry) ───────────
             yield _sse("step", {"phase": "memory_update", "turn": state.current_turn})
@@ -416,17 +450,8 @@ async def generate_story(req: GenerateRequest):
                         present_chars.add(name)
                 present_chars.add(next_speaker)  # Speaker always witnesses
 
-                # Update only present characters' memories
-                for name in present_chars:
-                    if name in characters_agents:
-                        mem = state.character_memories.get(name)
-                        if not mem or not isinstance(mem, CharacterMemory):
-                            mem = CharacterMemory()
-                        mem.recent_events.append(memory_line)
-                        mem.recent_events = mem.recent_events[-config.memory_buffer_size:]
-                        state.character_memories[name] = mem
-
                 # Knowledge and facts for actions
+                global_fact = None
                 if action_meta:
                     actor = action_meta.get("actor", next_speaker)
                     action_type = action_meta.get("type", "UNKNOWN")
@@ -438,18 +463,22 @@ async def generate_story(req: GenerateRequest):
                             mem.knowledge.append(f"I performed {action_type} at turn {last_event['turn']}")
 
                     # All present characters learn the fact
-                    fact_parts = [f"{action_type} by {actor}"]
-                    for k, v in world.items():
-                        if isinstance(v, bool) and v:
-                            fact_parts.append(k.replace('_', ' '))
-                    global_fact = "[FACT] " + " | ".join(fact_parts)
-                    for name in present_chars:
-                        if name in state.character_memories:
-                            mem = state.character_memories[name]
-                            if isinstance(mem, CharacterMemory):
-                                mem.knowledge.append(global_fact)
-                                mem.recent_events.append(global_fact)
-                                mem.recent_events = mem.recent_events[-config.memory_buffer_size:]
+                    global_fact = "[FACT] " + " | ".join([
+                        f"{action_type} by {actor}",
+                        *(k.replace('_', ' ') for k, v in world.items() if v is True),
+                    ])
+
+                # Update only present characters' memories
+                for name in present_chars:
+                    if name in characters_agents:
+                        mem = state.character_memories.get(name)
+                        if not mem or not isinstance(mem, CharacterMemory):
+                            mem = CharacterMemory()
+                            state.character_memories[name] = mem
+                        mem.remember(memory_line, config.memory_buffer_size)
+                        if global_fact:
+                            mem.knowledge.append(global_fact)
+                            mem.remember(global_fact, config.memory_buffer_size)
 
                 # Update speaker's emotional state
                 char_emotion = decision.get("emotion")
@@ -497,16 +526,23 @@ async def generate_story(req: GenerateRequest):
                 conclusion_reason = "Maximum turns reached"
             elif state.current_turn < min_conclusion_turn:
                 should_conclude = False
-            elif len(set(state.actions_taken)) < min_actions and state.current_turn < config.max_turns:
+            elif len(state.distinct_actions) < min_actions and state.current_turn < config.max_turns:
                 should_conclude = False
             else:
                 # Check for resolution signals before calling LLM
-                world = state.world_state or {}
-                has_resolution = any(world.get(k) for k in RESOLUTION_SIGNALS)
-                if not has_resolution and state.current_turn < config.max_turns:
+                if not state.has_resolution and state.current_turn < config.max_turns:
                     should_conclude = False
                 else:
-                    should_conclude, conclusion_reason = await director.check_conclusion(state)
+                    # One LLM call answers both "end now?" and "who's next?"
+                    next_force_act, next_endgame, _ = _turn_pacing(
+                        state, config, min_actions, action_system
+                    )
+                    turn_plan = await director.plan_turn(
+                        state, list(characters_agents.keys()),
+                        force_act=next_force_act, endgame=next_endgame,
+                    )
+                    should_conclude = turn_plan["should_end"]
+                    conclusion_reason = turn_plan["conclusion_narration"]
 
             yield _sse("conclusion_check", {
                 "turn": state.current_turn,
@@ -541,8 +577,8 @@ async def generate_story(req: GenerateRequest):
                 concluded_data = {
                     "turn": state.current_turn,
                     "reason": conclusion_narration,
-                    "totalActions": len(set(state.actions_taken)),
-                    "actionsTaken": list(set(state.actions_taken)),
+                    "totalActions": len(state.distinct_actions),
+                    "actionsTaken": list(state.distinct_actions),
                     "conclusionNarration": conclusion_narration,
                 }
                 yield _sse("concluded", concluded_data)
@@ -573,8 +609,8 @@ async def generate_story(req: GenerateRequest):
             final_concluded_data = {
                 "turn": state.current_turn,
                 "reason": conclusion_narration,
-                "totalActions": len(set(state.actions_taken)),
-                "actionsTaken": list(set(state.actions_taken)),
+                "totalActions": len(state.distinct_actions),
+                "actionsTaken": list(state.distinct_actions),
                 "conclusionNarration": conclusion_narration,
             }
             yield _sse("concluded", final_concluded_data)
@@ -591,20 +627,16 @@ async def generate_story(req: GenerateRequest):
         try:
             summary = {
                 "totalTurns": state.current_turn,
-                "totalActions": len(set(state.actions_taken)),
-                "actionsTaken": list(set(state.actions_taken)),
+                "totalActions": len(state.distinct_actions),
+                "actionsTaken": list(state.distinct_actions),
                 "conclusionReason": state.conclusion_reason or "Completed",
                 "worldState": state.world_state or {},
                 "status": "completed",
             }
-            if current_run_id:
-                # Update existing record with final summary
-                await update_story_run(
-                    run_id=current_run_id,
-                    events=state.events,
-                    timeline=sse_timeline,
-                    summary=summary,
-                )
+            if run_writer:
+                # Write the remaining tail together with the final summary
+                await run_writer.update(state.events, sse_timeline)
+                await run_writer.flush(summary=summary)
                 print(f"[Supabase] Story run completed: {current_run_id}")
             else:
                 # Fallback: create new record if incremental save wasn't available
@@ -624,41 +656,48 @@ async def generate_story(req: GenerateRequest):
 
 # ── Prompt logging ──────────────────────────────────────────────────────
 
-def _write_prompt_logs(
-    characters_agents: Dict[str, CharacterAgent],
-    director: DirectorAgent,
-):
-    """Collect logs from all agents and write to prompts_log.json."""
-    all_logs = []
-
-    # Director logs
-    for entry in director.logs:
-        all_logs.append({
+def _log_rows(logs: List[Dict[str, Any]], role: Optional[str] = None):
+    """Exported fields of one agent's prompt log, in write order."""
+    for entry in logs:
+        row = {
             "timestamp": entry["timestamp"],
             "agent": entry["agent"],
             "prompt": entry["prompt"],
             "response": entry["response"],
-            "role": "Director",
-        })
+        }
+        if role:
+            row["role"] = role
+        yield row
 
-    # Character agent logs
-    for name, agent in characters_agents.items():
-        for entry in agent.logs:
-            all_logs.append({
-                "timestamp": entry["timestamp"],
-                "agent": entry["agent"],
-                "prompt": entry["prompt"],
-                "response": entry["response"],
-                "role": f"Character ({name})",
-            })
 
-    # Sort by timestamp
-    all_logs.sort(key=lambda x: x["timestamp"])
+def _merged_logs(
+    characters_agents: Dict[str, CharacterAgent],
+    director: DirectorAgent,
+    with_role: bool,
+) -> List[Dict[str, Any]]:
+    """All agents' prompt logs in timestamp order.
+
+    Each agent appends to its log chronologically, so the per-agent
+    streams are k-way merged instead of concatenated and re-sorted.
+    """
+    streams = [_log_rows(director.logs, "Director" if with_role else None)]
+    streams.extend(
+        _log_rows(agent.logs, f"Character ({name})" if with_role else None)
+        for name, agent in characters_agents.items()
+    )
+    return list(heapq.merge(*streams, key=itemgetter("timestamp")))
+
+
+def _write_prompt_logs(
+    characters_agents: Dict[str, CharacterAgent],
+    director: DirectorAgent,
+):
+    """Collect logs from all agents and write to prompts_log.json."""
+    all_logs = _merged_logs(characters_agents, director, with_role=True)
 
     log_path = project_root / "prompts_log.json"
     try:
-        with open(log_path, "w", encoding="utf-8") as f:
-            json.dump(all_logs, f, indent=2, ensure_ascii=False, default=str)
+        log_path.write_bytes(dump_pretty(all_logs))
         print(f"\n[LOG] Wrote {len(all_logs)} prompt logs to {log_path}")
     except Exception as e:
         print(f"[LOG ERROR] Failed to write prompt logs: {e}")
@@ -700,8 +739,7 @@ def _write_story_output(state: StoryState, seed_story: dict):
 
     output_path = project_root / "story_output.json"
     try:
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False, default=str)
+        output_path.write_bytes(dump_pretty(output_data))
         print(f"[OUTPUT] Story saved to {output_path}")
     except Exception as e:
         print(f"[OUTPUT ERROR] Failed to write story output: {e}")
@@ -712,32 +750,12 @@ def _write_prompts_jsonl(
     director: DirectorAgent,
 ):
     """Write prompts.jsonl — one JSON object per line for each LLM interaction."""
-    all_logs = []
-
-    for entry in director.logs:
-        all_logs.append({
-            "timestamp": entry["timestamp"],
-            "agent": entry["agent"],
-            "prompt": entry["prompt"],
-            "response": entry["response"],
-        })
-
-    for name, agent in characters_agents.items():
-        for entry in agent.logs:
-            all_logs.append({
-                "timestamp": entry["timestamp"],
-                "agent": entry["agent"],
-                "prompt": entry["prompt"],
-                "response": entry["response"],
-            })
-
-    all_logs.sort(key=lambda x: x["timestamp"])
+    all_logs = _merged_logs(characters_agents, director, with_role=False)
 
     jsonl_path = project_root / "prompts.jsonl"
     try:
-        with open(jsonl_path, "w", encoding="utf-8") as f:
-            for log_entry in all_logs:
-                f.write(json.dumps(log_entry, ensure_ascii=False, default=str) + "\n")
+        with open(jsonl_path, "wb") as f:
+            f.writelines(dump_line(log_entry) for log_entry in all_logs)
         print(f"[LOG] Wrote {len(all_logs)} entries to {jsonl_path}")
     except Exception as e:
         print(f"[LOG ERROR] Failed to write prompts.jsonl: {e}")
@@ -5,9 +5,13 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StoryConfig:
-    """Configuration for the story simulation."""
+    """Configuration for the story simulation.
+
+    Immutable and shared by every agent of a run — pass overrides to the
+    constructor (or use ``dataclasses.replace``) instead of assigning.
+    """
     model_name: str = os.getenv("GROQ_MODEL", "llama-3.3-70b-versatile")
     temperature: float = 0.8  # Slightly higher for more creative dialogue
 
@@ -21,4 +25,9 @@ class StoryConfig:
     # Action system - min_actions is dynamically calculated as ~20% of max_turns
     min_actions: int = 5  # Default for 25 turns, will be recalculated
     memory_buffer_size: int = 8
+
+    # Run the likely speaker's turn alongside the director's speaker pick;
+    # the result is dropped if the director chooses someone else.  Off by
+    # default: a miss costs a whole extra (throttled) LLM call.
+    speculative_character_turns: bool = False
     
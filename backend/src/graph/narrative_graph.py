@@ -6,20 +6,79 @@ Plans the story arc upfront and drives toward conclusion within
 the turn budget.
 
 Nodes:
-  director_select → character_reason → process_action → memory_update
-      → check_conclusion → (conclude | director_select)
+  director_select → character_reason → process_action → after_action
+      → (conclude | director_select)
+
+after_action runs the memory update and the conclusion check together.
 """
 
-from typing import Dict, List, Any, Optional
+import asyncio
+import logging
+import operator
+from datetime import datetime
+from typing import Annotated, Callable, Dict, List, Any, Optional, Tuple
+from pydantic import Field, SkipValidation
+from langchain_core.runnables import RunnableConfig
 from langgraph.graph import StateGraph, END
 from ..config import StoryConfig
 from ..schemas import StoryState, CharacterProfile, CharacterMemory, DialogueTurn
 from ..agents.character_agent import CharacterAgent
 from ..agents.director_agent import DirectorAgent
-from ..action_system import ActionSystem, RESOLUTION_SIGNALS
+from ..action_system import ActionSystem
+
+log = logging.getLogger(__name__)
+
+
+class _GraphState(StoryState):
+    """StoryState as LangGraph rebuilds it from channel values.
+
+    The append-only history channels are validated when the run starts and
+    only grow by entries the nodes build from trusted values, so they are
+    marked ``SkipValidation`` instead of being re-validated in full before
+    every node.  All other fields are still validated on each rebuild.
+    """
+
+    story_narration: Annotated[SkipValidation[List[str]], operator.add] = Field(
+        default_factory=list
+    )
+    dialogue_history: Annotated[
+        SkipValidation[List[DialogueTurn]], operator.add
+    ] = Field(default_factory=list)
+    events: Annotated[SkipValidation[List[Dict[str, Any]]], operator.add] = Field(
+        default_factory=list
+    )
+    director_notes: Annotated[SkipValidation[List[str]], operator.add] = Field(
+        default_factory=list
+    )
+    actions_taken: Annotated[SkipValidation[List[str]], operator.add] = Field(
+        default_factory=list
+    )
+    emotion_history: Annotated[
+        SkipValidation[List[Dict[str, Any]]], operator.add
+    ] = Field(default_factory=list)
+
+
+def _bound_node(method_name: str):
+    """Graph node that runs *method_name* on the NarrativeGraph of this run.
+
+    The compiled graph is shared by every NarrativeGraph, so nodes can't
+    close over one instance; run() passes itself in the config instead.
+    """
+    async def node(state: StoryState, config: RunnableConfig) -> Dict:
+        narrative = config["configurable"]["narrative_graph"]
+        return await getattr(narrative, method_name)(state)
+
+    node.__name__ = method_name
+    return node
 
 
 class NarrativeGraph:
+    # Actions that create resolution signals, in endgame preference order
+    _RESOLUTION_ACTIONS = (
+        "NEGOTIATE", "ACCEPT_TERMS", "MAKE_PAYMENT",
+        "TAKE_DECISIVE_ACTION", "SUMMON_HELP",
+    )
+
     def __init__(
         self,
         config: StoryConfig,
@@ -30,35 +89,43 @@ class NarrativeGraph:
         self.characters = {c.name: c for c in characters}
         self.director = director
         self.action_system = ActionSystem()
-        self.graph = self._build_graph()
+        self.graph = self._get_compiled_graph()
 
     # ── graph construction ──────────────────────────────────────────────
 
-    def _build_graph(self) -> StateGraph:
-        workflow = StateGraph(StoryState)
+    # The topology never changes, so it is compiled once per process
+    _compiled_graph = None
+
+    @classmethod
+    def _get_compiled_graph(cls):
+        if cls._compiled_graph is None:
+            cls._compiled_graph = cls._build_graph()
+        return cls._compiled_graph
+
+    @classmethod
+    def _build_graph(cls):
+        workflow = StateGraph(_GraphState)
 
-        workflow.add_node("director_select", self._director_select_node)
-        workflow.add_node("character_reason", self._character_reason_node)
-        workflow.add_node("process_action", self._process_action_node)
-        workflow.add_node("memory_update", self._memory_update_node)
-        workflow.add_node("check_conclusion", self._check_conclusion_node)
-        workflow.add_node("conclude", self._conclude_node)
+        workflow.add_node("director_select", _bound_node("_director_select_node"))
+        workflow.add_node("character_reason", _bound_node("_character_reason_node"))
+        workflow.add_node("process_action", _bound_node("_process_action_node"))
+        workflow.add_node("after_action", _bound_node("_after_action_node"))
+        workflow.add_node("conclude", _bound_node("_conclude_node"))
 
         workflow.set_entry_point("director_select")
 
         workflow.add_conditional_edges(
             "director_select",
-            self._route_after_director,
+            cls._route_after_director,
             {"character_reason": "character_reason", "conclude": "conclude"},
         )
 
         workflow.add_edge("character_reason", "process_action")
-        workflow.add_edge("process_action", "memory_update")
-        workflow.add_edge("memory_update", "check_conclusion")
+        workflow.add_edge("process_action", "after_action")
 
         workflow.add_conditional_edges(
-            "check_conclusion",
-            self._route_conclusion,
+            "after_action",
+            cls._route_conclusion,
             {"conclude": "conclude", "continue": "director_select"},
         )
 
@@ -87,55 +154,27 @@ class NarrativeGraph:
         that create resolution signals (NEGOTIATE, ACCEPT_TERMS,
         MAKE_PAYMENT, TAKE_DECISIVE_ACTION, SUMMON_HELP).
         """
-        used = set(state.actions_taken)
-        allowed = set(self.action_system.get_allowed_actions(state))
-        candidates = allowed - used
+        allowed = self.action_system.get_allowed_action_set(state)
+        candidates = allowed.difference(state.distinct_actions)
         if not candidates:
             return None
 
         if prefer_resolution:
-            resolution_actions = [
-                "NEGOTIATE", "ACCEPT_TERMS", "MAKE_PAYMENT",
-                "TAKE_DECISIVE_ACTION", "SUMMON_HELP",
-            ]
-            for ra in resolution_actions:
+            for ra in self._RESOLUTION_ACTIONS:
                 if ra in candidates:
                     return ra
 
-        return sorted(candidates)[0]
+        return min(candidates)
 
-    # ════════════════════════════════════════════════════════════════════
-    #  NODE IMPLEMENTATIONS
-    # ════════════════════════════════════════════════════════════════════
+    # ── deterministic pacing rules ────────────────────────────────────
 
-    async def _director_select_node(self, state: StoryState) -> Dict:
-        """Director selects the next speaker + enforces deterministic rules."""
+    def _turn_pacing(self, state: StoryState) -> Tuple[bool, bool, Optional[str]]:
+        """Deterministic pacing rules for the turn about to start.
 
+        Returns (force_act, endgame, suggested_action).
+        """
         total = state.total_turns or self.config.max_turns
-
-        # ── Hard stop — generate proper LLM conclusion ──────────────────
-        if state.current_turn >= total:
-            try:
-                conclusion_narration = await self.director.generate_final_conclusion(state)
-            except Exception:
-                conclusion_narration = "The scene finally draws to a close as the moment passes."
-
-            return {
-                "is_concluded": True,
-                "conclusion_reason": conclusion_narration,
-                "events": state.events
-                + [
-                    {
-                        "type": "narration",
-                        "content": conclusion_narration,
-                        "turn": state.current_turn,
-                        "metadata": {"conclusion": True},
-                    }
-                ],
-            }
-
-        # ── Deterministic pacing rules ──────────────────────────────────
-        distinct_actions = len(set(state.actions_taken))
+        distinct_actions = len(state.distinct_actions)
         remaining = total - state.current_turn
         # Scale min_actions proportionally: ~20% of total turns
         min_actions = max(3, total // 5)
@@ -150,12 +189,7 @@ class NarrativeGraph:
             force_act = True
 
         # ── Dialogue streak breaker: force action after 2+ talk-only turns
-        dialogue_streak = 0
-        for t in reversed(state.dialogue_history):
-            if "[ACTION:" not in t.dialogue:
-                dialogue_streak += 1
-            else:
-                break
+        dialogue_streak = state.talk_streak
         if dialogue_streak >= 2 and distinct_actions < min_actions:
             force_act = True
 
@@ -175,9 +209,7 @@ class NarrativeGraph:
         # In the last ~20% of turns, if no resolution signal yet,
         # force resolution-oriented actions even if min_actions are met.
         if endgame:
-            world = state.world_state or {}
-            has_resolution = any(world.get(k) for k in RESOLUTION_SIGNALS)
-            if not has_resolution:
+            if not state.has_resolution:
                 force_act = True
                 suggested_action = self._pick_suggested_action(
                     state, prefer_resolution=True
@@ -188,7 +220,10 @@ class NarrativeGraph:
                 state, prefer_resolution=endgame
             )
 
-        # ── Filter out departed characters ───────────────────────────────
+        return force_act, endgame, suggested_action
+
+    def _available_characters(self, state: StoryState) -> List[str]:
+        """Characters still in the scene (departed ones filtered out)."""
         world = state.world_state or {}
         available = [
             name for name in self.characters.keys()
@@ -196,24 +231,83 @@ class NarrativeGraph:
         ]
         if not available:
             available = list(self.characters.keys())  # safety fallback
-        next_speaker, narration = await self.director.select_next_speaker(
-            state, available, force_act=force_act, endgame=endgame
-        )
+        return available
 
-        print("=" * 60)
-        print(
-            f"Director | Turn {state.current_turn + 1}/{total} "
-            f"| Force ACT: {force_act} | Endgame: {endgame}"
-        )
-        print(f"  Narration : {narration}")
-        print(f"  Speaker   : {next_speaker}")
-        print(
-            f"  Actions   : {distinct_actions} distinct "
-            f"({state.actions_taken})"
-        )
-        if suggested_action:
-            print(f"  Suggested : {suggested_action}")
-        print("=" * 60, "\n")
+    # ════════════════════════════════════════════════════════════════════
+    #  NODE IMPLEMENTATIONS
+    # ════════════════════════════════════════════════════════════════════
+
+    async def _director_select_node(self, state: StoryState) -> Dict:
+        """Director selects the next speaker + enforces deterministic rules."""
+
+        total = state.total_turns or self.config.max_turns
+
+        # ── Hard stop — generate proper LLM conclusion ──────────────────
+        if state.current_turn >= total:
+            try:
+                conclusion_narration = await self.director.generate_final_conclusion(state)
+            except Exception:
+                conclusion_narration = "The scene finally draws to a close as the moment passes."
+
+            return {
+                "is_concluded": True,
+                "conclusion_reason": conclusion_narration,
+                "events": [
+                    {
+                        "type": "narration",
+                        "content": conclusion_narration,
+                        "turn": state.current_turn,
+                        "metadata": {"conclusion": True},
+                    }
+                ],
+            }
+
+        force_act, endgame, suggested_action = self._turn_pacing(state)
+        available = self._available_characters(state)
+
+        # Reuse the speaker chosen alongside last turn's conclusion check
+        plan = (state.pending_decision or {}).get("director_plan")
+        speculative = None
+        if plan and plan.get("next_speaker") in available:
+            next_speaker, narration = plan["next_speaker"], plan.get("narration", "")
+        elif self.config.speculative_character_turns:
+            # The character prompt doesn't read the director's narration,
+            # so the likely speaker can reason while the director decides.
+            guess = self.director.likely_speaker(state, available)
+            guess_logs = self.characters[guess].logs
+            logged = len(guess_logs)
+            (next_speaker, narration), decision = await asyncio.gather(
+                self.director.select_next_speaker(
+                    state, available, force_act=force_act, endgame=endgame
+                ),
+                self._decide(state, guess, force_act, suggested_action),
+            )
+            if next_speaker == guess:
+                speculative = {"speaker": guess, "decision": decision}
+            else:
+                # Keep the prompt logs to interactions that made the story
+                del guess_logs[logged:]
+                log.debug("  Speculative turn for %s discarded", guess)
+        else:
+            next_speaker, narration = await self.director.select_next_speaker(
+                state, available, force_act=force_act, endgame=endgame
+            )
+
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("=" * 60)
+            log.debug(
+                "Director | Turn %d/%d | Force ACT: %s | Endgame: %s",
+                state.current_turn + 1, total, force_act, endgame,
+            )
+            log.debug("  Narration : %s", narration)
+            log.debug("  Speaker   : %s", next_speaker)
+            log.debug(
+                "  Actions   : %d distinct (%s)",
+                len(state.distinct_actions), state.actions_taken,
+            )
+            if suggested_action:
+                log.debug("  Suggested : %s", suggested_action)
+            log.debug("%s\n", "=" * 60)
 
         events_update: list = []
         if narration:
@@ -221,20 +315,21 @@ class NarrativeGraph:
                 {"type": "narration", "content": narration, "turn": state.current_turn}
             )
 
-        return {
+        updates = {
+            "turn_started_at": datetime.now(),
             "next_speaker": next_speaker,
             "force_act": force_act,
             "suggested_action": suggested_action,
-            "director_notes": state.director_notes
-            + [
+            "director_notes": [
                 f"Turn {state.current_turn + 1}: {next_speaker}"
                 + (" [FORCE ACT]" if force_act else "")
             ],
-            "story_narration": (
-                state.story_narration + [narration] if narration else state.story_narration
-            ),
-            "events": state.events + events_update,
+            "story_narration": [narration] if narration else [],
+            "events": events_update,
         }
+        if speculative:
+            updates["pending_decision"] = {"speculative": speculative}
+        return updates
 
     # ────────────────────────────────────────────────────────────────────
 
@@ -245,34 +340,55 @@ class NarrativeGraph:
         if not next_speaker or next_speaker not in self.characters:
             next_speaker = list(self.characters.keys())[0]
 
-        character = self.characters[next_speaker]
+        # Reuse the turn already reasoned while the director was choosing
+        speculative = (state.pending_decision or {}).get("speculative")
+        if speculative and speculative["speaker"] == next_speaker:
+            decision = speculative["decision"]
+        else:
+            decision = await self._decide(
+                state, next_speaker, state.force_act, state.suggested_action
+            )
+
+        if log.isEnabledFor(logging.DEBUG):
+            mode = decision.get("mode", "TALK")
+            log.debug("  %s decides: %s", next_speaker, mode)
+            if mode == "ACT":
+                log.debug("    Action: %s", decision.get("action", {}).get("type", "?"))
+            else:
+                log.debug("    Speech: %s…\n", (decision.get("speech") or "")[:80])
+
+        return {"pending_decision": decision}
+
+    async def _decide(
+        self,
+        state: StoryState,
+        speaker: str,
+        force_act: bool,
+        suggested_action: Optional[str],
+    ) -> Dict[str, Any]:
+        """Run *speaker*'s TALK/ACT reasoning against *state*.
+
+        The pacing flags are passed in rather than read from *state* so a
+        speculative turn can run before the director's updates land.
+        """
         allowed_actions = self.action_system.get_allowed_actions(state)
 
-        if state.suggested_action and state.suggested_action in allowed_actions:
+        if suggested_action and suggested_action in allowed_actions:
             # Put suggested action first but keep others as fallback
-            allowed_actions = [state.suggested_action] + [
-                a for a in allowed_actions if a != state.suggested_action
+            allowed_actions = [suggested_action] + [
+                a for a in allowed_actions if a != suggested_action
             ]
 
-        memories = state.character_memories.get(next_speaker, CharacterMemory())
+        memories = state.character_memories.get(speaker, CharacterMemory())
 
-        decision = await character.reason_and_decide(
+        return await self.characters[speaker].reason_and_decide(
             story_state=state,
             memories=memories,
             allowed_actions=allowed_actions,
-            force_act=state.force_act,
+            force_act=force_act,
+            suggested_action=suggested_action,
         )
 
-        mode = decision.get("mode", "TALK")
-        print(f"  {next_speaker} decides: {mode}")
-        if mode == "ACT":
-            print(f"    Action: {decision.get('action', {}).get('type', '?')}")
-        else:
-            print(f"    Speech: {(decision.get('speech') or '')[:80]}…")
-        print()
-
-        return {"pending_decision": decision}
-
     # ────────────────────────────────────────────────────────────────────
 
     async def _process_action_node(self, state: StoryState) -> Dict:
@@ -285,14 +401,14 @@ class NarrativeGraph:
         # ── ACT path ───────────────────────────────────────────────────
         if mode == "ACT" and decision.get("action"):
             action = decision["action"]
-            success, effects, narration = self.action_system.execute(
+            success, effects, narration, action_type = self.action_system.execute(
                 action, state, speaker
             )
 
             if success:
                 updates: Dict[str, Any] = {
                     "current_turn": state.current_turn + 1,
-                    "actions_taken": state.actions_taken + [action["type"]],
+                    "actions_taken": [action_type],
                     "turns_since_state_change": 0,
                     "force_act": False,
                     "suggested_action": None,
@@ -306,23 +422,25 @@ class NarrativeGraph:
                     "speaker": speaker,
                     "turn": state.current_turn + 1,
                     "metadata": {
-                        "action": {"type": action["type"], "actor": speaker}
+                        "action": {"type": action_type, "actor": speaker}
                     },
                 }
-                updates["events"] = state.events + [new_event]
+                updates["events"] = [new_event]
 
-                new_turn = DialogueTurn(
+                # Fields are built here from trusted values — skip validation
+                new_turn = DialogueTurn.model_construct(
                     turn_number=state.current_turn + 1,
                     speaker=speaker,
-                    dialogue=f"[ACTION: {action['type']}] {narration}",
-                    metadata={"action_type": action["type"]},
+                    dialogue=f"[ACTION: {action_type}] {narration}",
+                    timestamp=state.turn_started_at or datetime.now(),
+                    metadata={"action_type": action_type},
                 )
-                updates["dialogue_history"] = state.dialogue_history + [new_turn]
+                updates["dialogue_history"] = [new_turn]
 
                 return updates
 
             # action failed → fall through to TALK
-            print(f"  Action failed: {narration}. Falling back to TALK.")
+            log.debug("  Action failed: %s. Falling back to TALK.", narration)
             decision = {
                 "mode": "TALK",
                 "speech": decision.get("speech")
@@ -332,10 +450,11 @@ class NarrativeGraph:
         # ── TALK path (default) ─────────────────────────────────────────
         speech = decision.get("speech") or "…"
 
-        new_turn = DialogueTurn(
+        new_turn = DialogueTurn.model_construct(
             turn_number=state.current_turn + 1,
             speaker=speaker,
             dialogue=speech,
+            timestamp=state.turn_started_at or datetime.now(),
         )
         new_event = {
             "type": "dialogue",
@@ -345,9 +464,9 @@ class NarrativeGraph:
         }
 
         return {
-            "dialogue_history": state.dialogue_history + [new_turn],
+            "dialogue_history": [new_turn],
             "current_turn": state.current_turn + 1,
-            "events": state.events + [new_event],
+            "events": [new_event],
             "turns_since_state_change": state.turns_since_state_change + 1,
             "force_act": False,
             "suggested_action": None,
@@ -356,16 +475,45 @@ class NarrativeGraph:
 
     # ────────────────────────────────────────────────────────────────────
 
+    async def _after_action_node(self, state: StoryState) -> Dict:
+        """Memory update and conclusion check for the turn just processed.
+
+        Both read only the post-action state and write disjoint fields, so
+        they run side by side in one step instead of two.
+        """
+        memory_updates, conclusion_updates = await asyncio.gather(
+            self._memory_update_node(state),
+            self._check_conclusion_node(state),
+        )
+        return {**memory_updates, **conclusion_updates}
+
+    # ────────────────────────────────────────────────────────────────────
+
     async def _memory_update_node(self, state: StoryState) -> Dict:
         """Update per-character structured memory with information asymmetry."""
 
-        # Deep copy existing memories
-        memories: Dict[str, CharacterMemory] = {}
+        # Earlier state snapshots (and the run() checkpoint) still reference
+        # the current memories, so build a new dict and copy each memory
+        # the first time this turn touches it; untouched ones are shared.
+        memories: Dict[str, CharacterMemory] = dict(state.character_memories)
+        copied: set = set()
+
+        def touch(name: str) -> CharacterMemory:
+            mem = memories[name]
+            if name not in copied:
+                mem = mem.model_copy(update={
+                    "knowledge": list(mem.knowledge),
+                    "recent_events": list(mem.recent_events),
+                })
+                memories[name] = mem
+                copied.add(name)
+            return mem
+
         for name in self.characters:
-            existing = state.character_memories.get(name)
-            if existing and isinstance(existing, CharacterMemory):
-                memories[name] = existing.model_copy(deep=True)
-            elif existing and isinstance(existing, dict):
+            existing = memories.get(name)
+            if isinstance(existing, CharacterMemory):
+                continue
+            if existing and isinstance(existing, dict):
                 memories[name] = CharacterMemory(**existing)
             else:
                 memories[name] = CharacterMemory()
@@ -401,43 +549,38 @@ class NarrativeGraph:
             preview = (last_event.get("content") or "")[:80]
             memory_line = f"T{last_event['turn']}: {preview}"
 
-        # ── Update only PRESENT characters (information asymmetry) ──────
-        for name in present_characters:
-            if name in memories:
-                mem = memories[name]
-                mem.recent_events.append(memory_line)
-                mem.recent_events = mem.recent_events[-max_mem:]
-
-        # ── Update knowledge and facts for state-changing actions ───────
+        # ── Observable fact for state-changing actions ──────────────────
+        global_fact = None
         if action_meta:
             actor = action_meta.get("actor", speaker)
             action_type = action_meta.get("type", "UNKNOWN")
 
             # Actor gains specific knowledge about their action
             if actor in memories:
-                memories[actor].knowledge.append(
+                touch(actor).knowledge.append(
                     f"I performed {action_type} at turn {last_event['turn']}"
                 )
 
-            # All present characters learn the observable fact
-            fact_parts = [f"{action_type} by {actor}"]
-            for k, v in world.items():
-                if isinstance(v, bool) and v:
-                    fact_parts.append(k.replace("_", " "))
-            global_fact = "[FACT] " + " | ".join(fact_parts)
+            global_fact = "[FACT] " + " | ".join([
+                f"{action_type} by {actor}",
+                *(k.replace("_", " ") for k, v in world.items() if v is True),
+            ])
 
-            for name in present_characters:
-                if name in memories:
-                    mem = memories[name]
-                    mem.knowledge.append(global_fact)
-                    mem.recent_events.append(global_fact)
-                    mem.recent_events = mem.recent_events[-max_mem:]
+        # ── Update only PRESENT characters (information asymmetry) ──────
+        for name in present_characters:
+            if name not in memories:
+                continue
+            mem = touch(name)
+            mem.remember(memory_line, max_mem)
+            if global_fact:
+                mem.knowledge.append(global_fact)
+                mem.remember(global_fact, max_mem)
 
         # ── Update speaker's emotional state from their decision ────────
         decision = state.pending_decision or {}
         emotion = decision.get("emotion")
         if emotion and speaker in memories:
-            memories[speaker].emotional_state = emotion
+            touch(speaker).emotional_state = emotion
 
         # ── Track emotion history ───────────────────────────────────────
         emotion_entry = None
@@ -450,7 +593,7 @@ class NarrativeGraph:
 
         updates = {"character_memories": memories}
         if emotion_entry:
-            updates["emotion_history"] = state.emotion_history + [emotion_entry]
+            updates["emotion_history"] = [emotion_entry]
 
         return updates
 
@@ -468,7 +611,7 @@ class NarrativeGraph:
         min_actions = max(2, total // 5)
         # Conclusion can happen after 50% of turns (for movie-like pacing)
         min_turns = max(3, total // 2)
-        distinct_actions = len(set(state.actions_taken))
+        distinct_actions = len(state.distinct_actions)
 
         # hard stop — generate proper LLM conclusion
         if state.current_turn >= total:
@@ -480,8 +623,7 @@ class NarrativeGraph:
             return {
                 "is_concluded": True,
                 "conclusion_reason": conclusion_narration,
-                "events": state.events
-                + [
+                "events": [
                     {
                         "type": "narration",
                         "content": conclusion_narration,
@@ -500,13 +642,20 @@ class NarrativeGraph:
             return {"is_concluded": False}
 
         # STRICT: do not end unless a resolution signal exists in world_state
-        world = state.world_state or {}
-        has_resolution = any(world.get(k) for k in RESOLUTION_SIGNALS)
-        if not has_resolution and state.current_turn < total:
+        if not state.has_resolution and state.current_turn < total:
             return {"is_concluded": False}
 
-        # LLM-assisted check (only reached with enough actions + resolution)
-        should_end, reason = await self.director.check_conclusion(state)
+        # LLM-assisted check (only reached with enough actions + resolution).
+        # Next turn's speaker selection reads the same state, so the director
+        # answers both in one call; _director_select_node reuses the pick.
+        force_act, endgame, _ = self._turn_pacing(state)
+        plan = await self.director.plan_turn(
+            state,
+            self._available_characters(state),
+            force_act=force_act,
+            endgame=endgame,
+        )
+        should_end, reason = plan["should_end"], plan["conclusion_narration"]
 
         if should_end:
             events_update = []
@@ -522,10 +671,20 @@ class NarrativeGraph:
             return {
                 "is_concluded": True,
                 "conclusion_reason": str(reason),
-                "events": state.events + events_update,
+                "events": events_update,
             }
 
-        return {"is_concluded": False}
+        if not plan["next_speaker"]:
+            return {"is_concluded": False}
+        return {
+            "is_concluded": False,
+            "pending_decision": {
+                "director_plan": {
+                    "next_speaker": plan["next_speaker"],
+                    "narration": plan["narration"],
+                }
+            },
+        }
 
     # ────────────────────────────────────────────────────────────────────
 
@@ -545,7 +704,7 @@ class NarrativeGraph:
                 conclusion_narration = "The story reaches its end."
 
             updates["conclusion_reason"] = conclusion_narration
-            updates["events"] = state.events + [
+            updates["events"] = [
                 {
                     "type": "narration",
                     "content": conclusion_narration,
@@ -565,8 +724,14 @@ class NarrativeGraph:
         seed_story: Dict,
         character_profiles: Optional[Dict[str, Any]] = None,
         total_turns: Optional[int] = None,
+        checkpoint: Optional[Callable[[Dict[str, Any]], None]] = None,
     ) -> StoryState:
-        """Execute the narrative game loop and return final state."""
+        """Execute the narrative game loop and return final state.
+
+        If *checkpoint* is given it is called with the state values each
+        time new events land, so callers can persist the transcript as
+        the story unfolds instead of only at the end.
+        """
 
         turns = total_turns or self.config.max_turns
 
@@ -601,7 +766,21 @@ class NarrativeGraph:
             story_arc_plan=arc_plan,
         )
 
-        final_state = await self.graph.ainvoke(
-            initial_state, config={"recursion_limit": 200}
-        )
+        run_config = {
+            "recursion_limit": 200,
+            "configurable": {"narrative_graph": self},
+        }
+        if checkpoint is None:
+            return await self.graph.ainvoke(initial_state, config=run_config)
+
+        final_state = None
+        events_seen = 0
+        async for values in self.graph.astream(
+            initial_state, config=run_config, stream_mode="values"
+        ):
+            final_state = values
+            events = values.get("events") or []
+            if len(events) != events_seen:
+                events_seen = len(events)
+                checkpoint(values)
         return final_state
@@ -0,0 +1,37 @@
+"""JSON I/O for the input and output files (seed stories, story, prompt logs).
+
+Uses orjson when it is installed and falls back to the stdlib otherwise.
+Encoders return UTF-8 bytes; values JSON can't represent are written as str().
+"""
+
+import json
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def dump_pretty(obj: Any) -> bytes:
+        """Two-space indented document."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str)
+
+    def dump_line(obj: Any) -> bytes:
+        """Compact single-line record with a trailing newline (JSONL)."""
+        return orjson.dumps(obj, default=str) + b"\n"
+except ImportError:  # orjson is optional — stdlib fallback
+    _loads = json.loads
+
+    def dump_pretty(obj: Any) -> bytes:
+        """Two-space indented document."""
+        return json.dumps(obj, indent=2, ensure_ascii=False, default=str).encode()
+
+    def dump_line(obj: Any) -> bytes:
+        """Compact single-line record with a trailing newline (JSONL)."""
+        return json.dumps(obj, ensure_ascii=False, default=str).encode() + b"\n"
+
+
+def load_file(path: Path) -> Any:
+    """Parse a JSON file straight from its bytes (no separate str decode)."""
+    return _loads(path.read_bytes())
@@ -11,13 +11,37 @@ If a key is exhausted or returns an error, automatically tries the next one.
 import os
 import re
 import asyncio
+import hashlib
+from collections import OrderedDict
 from typing import List, Optional, Tuple, Any
 from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime, timedelta
 from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_groq import ChatGroq
 
 
+# Exact-match response cache: identical (system, prompt) pairs are served
+# from memory instead of a fresh inference call. Opt-in via
+# LLM_RESPONSE_CACHE=true, for dev / replay runs only — it pins sampled
+# (temperature > 0) answers, so re-runs of a story would stop varying.
+_RESPONSE_CACHE_MAXSIZE = 512
+_RESPONSE_CACHE_TTL = 3600.0  # seconds
+
+
+@lru_cache(maxsize=64)
+def _prefix_hasher(system: str) -> "hashlib.blake2b":
+    """blake2b state after absorbing *system* and the separator.
+
+    System prefixes are byte-identical across an agent's turns, so each is
+    encoded and hashed once; cache keys copy this state and add the prompt.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(system.encode())
+    h.update(b"\x00")
+    return h
+
+
 @dataclass
 class APIKeyStatus:
     """Track status of each API key."""
@@ -42,6 +66,7 @@ class LLMProvider:
         self.api_keys: List[APIKeyStatus] = []
         self._current_index = 0
         self._lock = asyncio.Lock()
+        self._throttle_lock = asyncio.Lock()
         self._last_request_time: Optional[datetime] = None
         self._min_request_interval = 4.0  # seconds between requests to avoid RPM limits
         
@@ -51,6 +76,12 @@ class LLMProvider:
         # Track which LLM instances are created
         self._llm_cache: dict = {}
 
+        # prompt hash -> (response_text, provider_name, stored_at)
+        self._response_cache: "OrderedDict[str, Tuple[str, str, datetime]]" = OrderedDict()
+        self._response_cache_enabled = (
+            os.getenv("LLM_RESPONSE_CACHE", "false").strip().lower() == "true"
+        )
+
     def _load_api_keys(self):
         """Load API keys from environment variables, respecting GEMINI_ENABLED / GROQ_ENABLED toggles."""
         gemini_enabled = os.getenv("GEMINI_ENABLED", "true").strip().lower() == "true"
@@ -237,13 +268,56 @@ class LLMProvider:
         
         return earliest_index
 
-    async def generate(self, prompt: str) -> Tuple[str, str]:
+    # ── Response cache ──────────────────────────────────────────────
+
+    @staticmethod
+    def _response_cache_key(prompt: str, system: Optional[str]) -> str:
+        """blake2b digest of the exact (system, prompt) pair."""
+        h = _prefix_hasher(system or "").copy()
+        h.update(prompt.encode())
+        return h.hexdigest()
+
+    def _cached_response(self, key: str) -> Optional[Tuple[str, str]]:
+        entry = self._response_cache.get(key)
+        if entry is None:
+            return None
+        text, provider, stored_at = entry
+        if (datetime.now() - stored_at).total_seconds() > _RESPONSE_CACHE_TTL:
+            del self._response_cache[key]
+            return None
+        self._response_cache.move_to_end(key)
+        return text, provider
+
+    def _store_response(self, key: str, text: str, provider: str):
+        self._response_cache[key] = (text, provider, datetime.now())
+        self._response_cache.move_to_end(key)
+        while len(self._response_cache) > _RESPONSE_CACHE_MAXSIZE:
+            self._response_cache.popitem(last=False)
+
+    def clear_response_cache(self):
+        """Drop every cached prompt → response pair."""
+        self._response_cache.clear()
+
+    async def generate(self, prompt: str, system: Optional[str] = None) -> Tuple[str, str]:
         """
         Generate a response using the best available LLM.
         Returns (response_text, provider_name).
+
+        *system* is sent as a leading system message. Keep it byte-identical
+        across calls so Gemini / Groq can serve it from their prefix cache;
+        anything that changes per turn belongs in *prompt*.
         
-        Automatically handles failover between API keys.
+        Automatically handles failover between API keys. Identical
+        (system, prompt) pairs are answered from the in-process response
+        cache when LLM_RESPONSE_CACHE=true.
         """
+        cache_key = None
+        if self._response_cache_enabled:
+            cache_key = self._response_cache_key(prompt, system)
+            cached = self._cached_response(cache_key)
+            if cached is not None:
+                return cached
+
         max_attempts = len(self.api_keys) * 3  # Retry each key up to 3 times
         attempts = 0
         last_error = None
@@ -282,23 +356,35 @@ class LLMProvider:
                     # Clear cooldown after waiting
                     key_status.cooldown_until = None
             
-            # Throttle: ensure minimum interval between requests
-            if self._last_request_time:
-                elapsed = (datetime.now() - self._last_request_time).total_seconds()
-                if elapsed < self._min_request_interval:
-                    await asyncio.sleep(self._min_request_interval - elapsed)
+            # Throttle: reserve the next send slot under the lock so that
+            # concurrent callers (asyncio.gather) queue up instead of all
+            # seeing the same elapsed time and firing together.
+            async with self._throttle_lock:
+                wait = 0.0
+                now = datetime.now()
+                if self._last_request_time:
+                    elapsed = (now - self._last_request_time).total_seconds()
+                    wait = max(0.0, self._min_request_interval - elapsed)
+                self._last_request_time = now + timedelta(seconds=wait)
+            if wait > 0:
+                await asyncio.sleep(wait)
             
             try:
                 llm = self._create_llm(key_status)
                 messages = [("human", prompt)]
-                self._last_request_time = datetime.now()
+                if system:
+                    messages.insert(0, ("system", system))
                 response = await llm.ainvoke(messages)
                 
                 # Success! Clear any previous cooldown
                 key_status.cooldown_until = None
                 key_status.last_error = None
-                
-                return response.content, f"{key_status.provider}:{key_status.model}"
+
+                provider_name = f"{key_status.provider}:{key_status.model}"
+                # Blank answers make the agents fall back; don't pin them
+                if cache_key is not None and response.content and response.content.strip():
+                    self._store_response(cache_key, response.content, provider_name)
+                return response.content, provider_name
 
             except Exception as e:
                 last_error = e
@@ -1,7 +1,10 @@
 import asyncio
-import json
+import heapq
+import logging
 import sys
 import os
+from dataclasses import fields
+from operator import itemgetter
 from pathlib import Path
 
 current_dir = Path(__file__).parent
@@ -14,6 +17,11 @@ from src.agents.character_agent import CharacterAgent
 from src.agents.director_agent import DirectorAgent
 from src.graph.narrative_graph import NarrativeGraph
 from src.story_state import StoryStateManager
+from src.json_utils import dump_pretty, dump_line, load_file
+
+# StoryConfig uses slots, so the class attribute is a slot descriptor,
+# not the default — read the dataclass field default instead
+_MAX_TURNS_DEFAULT = next(f.default for f in fields(StoryConfig) if f.name == "max_turns")
 
 
 def find_seed_story(story_name: str = None):
@@ -38,6 +46,54 @@ def find_seed_story(story_name: str = None):
     return None
 
 
+class _EventLog:
+    """Appends each new story event to an ndjson sidecar as the graph runs.
+
+    Only events added since the last call are written, so a crash keeps
+    the transcript so far without re-serialising the whole story per step.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._written = 0
+        path.write_bytes(b"")
+
+    def __call__(self, state: dict):
+        events = state.get("events") or []
+        if len(events) > self._written:
+            with open(self.path, "ab") as f:
+                f.writelines(dump_line(e) for e in events[self._written:])
+            self._written = len(events)
+
+
+def _format_transcript(events: list) -> str:
+    """The console transcript as one string, so it is written in one call."""
+    buf = ["\n=== STORY TRANSCRIPT ===\n\n"]
+    append = buf.append
+    for event in events:
+        if not isinstance(event, dict):
+            continue
+        etype = event.get("type", "")
+        turn = event.get("turn", "?")
+        if etype == "dialogue":
+            append(f"[Turn {turn}] {event.get('speaker')}:\n  {event.get('content')}\n\n")
+        elif etype == "narration":
+            action_meta = (event.get("metadata") or {}).get("action")
+            if action_meta:
+                append(
+                    f"[Turn {turn}] ** ACTION: {action_meta['type']} "
+                    f"by {action_meta['actor']} **\n"
+                )
+            append(f"[Narration] {event.get('content')}\n\n")
+    return "".join(buf)
+
+
+def _tagged_logs(logs: list, role: str):
+    """One agent's prompt-log entries, each tagged with its role."""
+    for entry in logs:
+        yield {**entry, "role": role}
+
+
 async def main():
     # Determine which story to run
     story_name = os.getenv("STORY_NAME", None)
@@ -50,21 +106,17 @@ async def main():
         print("Create examples/<story_name>/seed_story.json and character_configs.json")
         sys.exit(1)
 
-    seed_story = json.loads((examples_dir / "seed_story.json").read_text())
-    char_configs = json.loads((examples_dir / "character_configs.json").read_text())
-
-    # Initialize config
-    config = StoryConfig()
+    seed_story = load_file(examples_dir / "seed_story.json")
+    char_configs = load_file(examples_dir / "character_configs.json")
 
     # Allow overriding max_turns via environment or seed story
-    if "max_turns" in seed_story:
-        config.max_turns = seed_story["max_turns"]
+    max_turns = seed_story.get("max_turns", _MAX_TURNS_DEFAULT)
     env_turns = os.getenv("MAX_TURNS")
     if env_turns:
-        config.max_turns = int(env_turns)
+        max_turns = int(env_turns)
 
-    # Auto-calculate min_actions based on turn budget
-    config.min_actions = max(5, config.max_turns // 5)
+    # Initialize config once; min_actions is auto-calculated from the turn budget
+    config = StoryConfig(max_turns=max_turns, min_actions=max(5, max_turns // 5))
 
     # Create character agents
     characters = [
@@ -89,42 +141,19 @@ async def main():
     print(f"  Min actions: {config.min_actions}")
     print(f"  Characters : {', '.join(c.name for c in characters)}\n")
 
-    # Run the game
+    # Run the game, streaming events to story_events.ndjson as they come in
     final_state = await story_graph.run(
         seed_story=seed_story,
         character_profiles=story_manager.state.character_profiles,
         total_turns=config.max_turns,
+        checkpoint=_EventLog(project_root / "story_events.ndjson"),
     )
 
-    # ── Print results ───────────────────────────────────────────────────
-    print("\n=== STORY TRANSCRIPT ===\n")
-    for event in final_state.get("events", []):
-        if isinstance(event, dict):
-            etype = event.get("type", "")
-            turn = event.get("turn", "?")
-            if etype == "dialogue":
-                print(f"[Turn {turn}] {event.get('speaker')}:")
-                print(f"  {event.get('content')}\n")
-            elif etype == "narration":
-                action_meta = (event.get("metadata") or {}).get("action")
-                if action_meta:
-                    print(
-                        f"[Turn {turn}] ** ACTION: {action_meta['type']} "
-                        f"by {action_meta['actor']} **"
-                    )
-                print(f"[Narration] {event.get('content')}\n")
-
     total_turns = final_state.get("current_turn", 0)
     actions = final_state.get("actions_taken", [])
     distinct = len(set(actions))
 
-    print(f"\n=== SUMMARY ===")
-    print(f"Total turns     : {total_turns}")
-    print(f"Conclusion      : {final_state.get('conclusion_reason')}")
-    print(f"Distinct actions: {distinct}")
-    print(f"Actions taken   : {actions}")
-
-    # ── Save story_output.json ──────────────────────────────────────────
+    # ── Save story_output.json (before any console output) ─────────────
     output_path = project_root / "story_output.json"
     output_data = {
         "title": seed_story.get("title"),
@@ -145,41 +174,47 @@ async def main():
             "emotion_history": final_state.get("emotion_history", []),
         },
     }
+    output_path.write_bytes(dump_pretty(output_data))
+
+    # ── Print results ───────────────────────────────────────────────────
+    sys.stdout.write(_format_transcript(final_state.get("events", [])))
 
-    output_path.write_text(json.dumps(output_data, indent=2, default=str))
+    print(f"\n=== SUMMARY ===")
+    print(f"Total turns     : {total_turns}")
+    print(f"Conclusion      : {final_state.get('conclusion_reason')}")
+    print(f"Distinct actions: {distinct}")
+    print(f"Actions taken   : {actions}")
     print(f"\nStory saved to {output_path}")
 
     # ── Save prompts_log.json ───────────────────────────────────────────
-    all_logs = []
-
-    for log in director.logs:
-        log["role"] = "Director"
-        all_logs.append(log)
-
-    for char in characters:
-        for log in char.logs:
-            log["role"] = f"Character ({char.name})"
-            all_logs.append(log)
-
-    all_logs.sort(key=lambda x: x["timestamp"])
+    # Each agent's log is already chronological — merge, don't re-sort
+    all_logs = list(heapq.merge(
+        _tagged_logs(director.logs, "Director"),
+        *(_tagged_logs(char.logs, f"Character ({char.name})") for char in characters),
+        key=itemgetter("timestamp"),
+    ))
 
     prompts_path = project_root / "prompts_log.json"
-    prompts_path.write_text(json.dumps(all_logs, indent=2, default=str))
+    prompts_path.write_bytes(dump_pretty(all_logs))
     print(f"Prompts saved to {prompts_path}")
 
     # ── Save prompts.jsonl ───────────────────────────────────────────────
     jsonl_path = project_root / "prompts.jsonl"
-    with open(jsonl_path, "w", encoding="utf-8") as f:
-        for log_entry in all_logs:
-            entry_data = {
+    with open(jsonl_path, "wb") as f:
+        f.writelines(
+            dump_line({
                 "timestamp": log_entry["timestamp"],
                 "agent": log_entry["agent"],
                 "prompt": log_entry["prompt"],
                 "response": log_entry["response"],
-            }
-            f.write(json.dumps(entry_data, ensure_ascii=False, default=str) + "\n")
+            })
+            for log_entry in all_logs
+        )
     print(f"JSONL prompts saved to {jsonl_path}")
 
 
 if __name__ == "__main__":
+    # Turn-by-turn trace from the graph; set LOG_LEVEL=INFO to silence it
+    logging.basicConfig(format="%(message)s")
+    logging.getLogger("src").setLevel(os.getenv("LOG_LEVEL", "DEBUG").upper())
     asyncio.run(main())
@@ -5,34 +5,109 @@ explicit ALLOWED list passed in; the prompt tells the LLM that
 any other action will be rejected.
 """
 
-from typing import List, Optional, Any
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Tuple
 from ..schemas import CharacterProfile, CharacterMemory, StoryState
 from ..action_system import ACTION_DEFINITIONS
+from .phases import story_phase
 
 ALLOWED_ACTIONS = sorted(ACTION_DEFINITIONS.keys())
 
+# "  - NAME: description" prompt line per action, built once at import
+_ACTION_LINE_CACHE: Dict[str, str] = {
+    action_type: f"  - {action_type}: {defn.get('description', action_type)}"
+    for action_type, defn in ACTION_DEFINITIONS.items()
+}
 
-def _get_phase(current_turn: int, total_turns: int) -> str:
-    if total_turns <= 0:
-        return "setup"
-    progress = current_turn / total_turns
-    if progress < 0.15:
-        return "setup"
-    elif progress < 0.55:
-        return "conflict"
-    elif progress < 0.80:
-        return "climax"
-    else:
-        return "resolution"
+
+_CHAR_PHASE_HINTS: Dict[str, str] = {
+    "setup": "{name}, discover the situation. React with first impressions.",
+    "conflict": "{name}, tensions HIGH. Confront, accuse, defend, bargain — make your move.",
+    "climax": "{name}, BREAKING POINT. Take decisive action or say the words that change everything.",
+    "resolution": "{name}, story resolving. Deliver final words. Accept, resist, or walk away.",
+}
 
 
 def _char_phase_hint(phase: str, name: str) -> str:
-    return {
-        "setup": f"{name}, discover the situation. React with first impressions.",
-        "conflict": f"{name}, tensions HIGH. Confront, accuse, defend, bargain — make your move.",
-        "climax": f"{name}, BREAKING POINT. Take decisive action or say the words that change everything.",
-        "resolution": f"{name}, story resolving. Deliver final words. Accept, resist, or walk away.",
-    }.get(phase, f"{name}, continue naturally.")
+    return _CHAR_PHASE_HINTS.get(phase, "{name}, continue naturally.").format(name=name)
+
+
+# Fixed rules + output schema — identical for every character and turn,
+# so they sit at the end of the cacheable prefix.
+_CHARACTER_RULES = """PERFORMANCE RULES:
+1. EMOTIONAL AUTHENTICITY: Feel rage, fear, desperation, hope. Raw emotion.
+2. LANGUAGE CONSISTENCY (CRITICAL):
+   - Speak ENTIRELY in clear, natural English.
+   - NEVER use non-English words, transliteration, or code-switching.
+   - Use the tone, dialect, and expressions that fit your character's background,
+     but all dialogue must be in English.
+   - Example: Instead of "Bhai sahab, yeh kya hai?", say "Sir, what is this?"
+3. SPECIFICITY: Name things. Reference exact scene details. No generic lines.
+4. REACTIVITY: Respond to what just happened. Acknowledge, counter, twist.
+5. GOAL-DRIVEN: Every line pursues something — defend, accuse, demand, plead.
+6. ECONOMY: 2-4 sentences max. Every word earns its place.
+7. ANTI-FILLER: NEVER say "Let me think" or "What's going on?" — every line
+   must reveal info, shift power, escalate, or trigger reaction.
+8. FULL CONTEXT: Never give half-responses. Every line must feel complete,
+   grounded in the scene, and advance the story meaningfully.
+9. COMPLETION: Every sentence must be a complete thought. No trailing off,
+   no incomplete ideas, no fragmented speech unless dramatically intentional.
+
+WHEN TO ACT vs TALK:
+- TALK: communicate, persuade, accuse, defend, negotiate, reveal.
+  Dialogue must be COMPLETE sentences with full context. No fragments.
+- ACT: when words aren't enough — examine, call help, confront, pay, leave.
+  When YOU ACT, provide vivid narration in action.params.narration (2-3 complete sentences).
+  action.type must come from the ALLOWED list given each turn — any other
+  action type is INVALID and WILL BE REJECTED.
+
+DIALOGUE REQUIREMENTS:
+- Every line must be a COMPLETE thought, not half-finished.
+- Reference the CURRENT situation specifically — who's there, what just happened.
+- Advance the scene meaningfully — reveal something, change the dynamic, create tension.
+- NO vague statements like "I don't know what to say" or "This is confusing."
+- Every sentence must have clear subject, verb, and complete meaning.
+
+OUTPUT RULES (MANDATORY):
+- Return ONLY raw JSON. No backticks. No markdown fences. No prose before or after.
+- No trailing commas.
+- Every field must contain COMPLETE content — no half-sentences, no fragments.
+- Speech must be 2-4 COMPLETE sentences in clear English.
+- If you cannot comply, output a valid TALK response with complete dialogue.
+
+REQUIRED JSON:
+{
+  "observation": "What you notice right now (1 complete sentence)",
+  "reasoning": "Your internal thought (1-2 complete sentences)",
+  "emotion": "dominant emotion",
+  "mode": "TALK" or "ACT",
+  "speech": "Your dialogue — 2-4 complete sentences in English" or null,
+  "action": {"type": "ACTION_TYPE_FROM_LIST", "target": null, "params": {"narration": "2-3 complete cinematic sentences"}} or null
+}"""
+
+
+@lru_cache(maxsize=32)
+def _character_prefix(
+    character_name: str,
+    title: str,
+    profile_desc: str,
+    characters_text: str,
+    description: str,
+    goals_text: str,
+) -> str:
+    """Persona + rules prefix, memoised so each character's turns share one
+    string object (and its encoded form / hash downstream)."""
+    return f"""You are {character_name} in "{title}".
+
+YOU: {character_name} — {profile_desc}
+
+CHARACTERS:
+{characters_text}
+
+SCENE: {description}
+{goals_text}
+
+{_CHARACTER_RULES}"""
 
 
 def build_character_context_pack(
@@ -43,7 +118,14 @@ def build_character_context_pack(
     allowed_actions: List[str],
     force_act: bool,
     config,
-) -> str:
+    suggested_action: Optional[str] = None,
+) -> Tuple[str, str]:
+    """Return ``(cacheable_prefix, dynamic_suffix)`` for one character turn.
+
+    The prefix (persona, cast, scene, goals, rules, JSON schema) only
+    depends on the seed story and this character, so it is byte-identical
+    across their turns; everything that changes per turn is in the suffix.
+    """
     seed = story_state.seed_story or {}
     title = seed.get("title", "Untitled")
     description = seed.get("description", "An unfolding scene")
@@ -69,22 +151,21 @@ def build_character_context_pack(
     )
 
     # ── Turn / phase ────────────────────────────────────────────────
-    total = getattr(story_state, "total_turns", config.max_turns)
-    phase = _get_phase(story_state.current_turn, total)
+    total = story_state.total_turns
+    phase = story_phase(story_state.current_turn, total).lower()
     remaining = total - story_state.current_turn
     phase_hint = _char_phase_hint(phase, character_name)
 
     # ── Action tracking ─────────────────────────────────────────────
-    distinct_actions = len(set(story_state.actions_taken))
-    used_actions = sorted(set(story_state.actions_taken))
+    distinct_actions = len(story_state.distinct_actions)
+    used_actions = story_state.distinct_actions_sorted
     # Scale min_actions proportionally: ~20% of total turns
     min_actions = max(3, total // 5)
-    unused_actions = sorted(set(allowed_actions) - set(story_state.actions_taken))
 
     # ── Repetition detection ────────────────────────────────────────
     own_recent = [
         t.dialogue
-        for t in story_state.dialogue_history[-6:]
+        for t in story_state.recent_dialogue(6)
         if t.speaker == character_name and "[ACTION:" not in t.dialogue
     ]
     repetition_warning = ""
@@ -144,136 +225,80 @@ def build_character_context_pack(
         goals_text = "\nYOUR GOALS:\n" + "\n".join(f"  - {g}" for g in character_profile.goals)
 
     # ── Recent dialogue ─────────────────────────────────────────────
-    recent = story_state.dialogue_history[-4:]
+    recent = story_state.recent_dialogue(4)
     recent_text = (
-        "\n".join(f"  {t.speaker}: {t.dialogue[:160]}" for t in recent)
+        "\n".join(t.speech_line for t in recent)
         if recent
         else "  (No dialogue yet)"
     )
 
     # ── Allowed actions with descriptions ───────────────────────────
-    action_lines = []
-    for act in allowed_actions:
-        desc = ACTION_DEFINITIONS.get(act, {}).get("description", act)
-        used_tag = " [ALREADY USED]" if act in used_actions else ""
-        action_lines.append(f"  - {act}: {desc}{used_tag}")
-    actions_text = (
-        "\n".join(action_lines) or "  - No actions available"
+    used = story_state.distinct_actions
+    actions_text = "\n".join(
+        (_ACTION_LINE_CACHE.get(act) or f"  - {act}: {act}")
+        + (" [ALREADY USED]" if act in used else "")
+        for act in allowed_actions
+    ) or "  - No actions available"
+
+    # Static prefix — byte-identical every turn so providers can cache it
+    prefix = _character_prefix(
+        character_name, title, profile_desc, characters_text, description, goals_text
     )
 
+    parts = [
+        f"Turn {story_state.current_turn}/{total} | Phase: {phase.upper()} | Remaining: {remaining}\n"
+        f"Actions so far: {distinct_actions}/{min_actions} min distinct ({used_actions or 'none'})\n\n"
+        f"WORLD STATE:\n{world_text}\n\n"
+        f"YOUR MEMORY:\n{memory_text}\n\n"
+        f"RECENT:\n{recent_text}\n\n"
+        "ALLOWED PHYSICAL ACTIONS (ONLY these are valid — anything else is rejected):\n"
+        f"{actions_text}\n"
+    ]
+
     # ── Force-act instruction ───────────────────────────────────────
-    force_instruction = ""
     if force_act:
-        force_instruction = (
+        parts.append(
             '\n!! YOU MUST CHOOSE mode "ACT" THIS TURN. !!'
             "\n!! Pick an action from the ALLOWED list below. "
             "Dialogue alone is NOT enough. !!"
         )
+        unused_actions = sorted(set(allowed_actions) - story_state.distinct_actions)
         if unused_actions:
-            force_instruction += (
+            parts.append(
                 f"\n!! PREFER AN UNUSED ACTION: "
                 f"{', '.join(unused_actions[:4])} !!"
             )
-        suggested = getattr(story_state, "suggested_action", None)
+        suggested = suggested_action or story_state.suggested_action
         if suggested and suggested in allowed_actions:
-            force_instruction += (
+            parts.append(
                 f'\n!! MANDATORY: Perform "{suggested}". '
                 f'Set action.type to "{suggested}". !!'
             )
 
     # ── Pacing ──────────────────────────────────────────────────────
-    pacing = ""
     if remaining <= 1:
-        pacing = "\n!! FINAL TURN. Deliver your concluding line. !!"
+        parts.append("\n!! FINAL TURN. Deliver your concluding line. !!")
     elif remaining <= 3:
-        pacing = f"\n!! {remaining} turns left. Push toward resolution. !!"
-
-    return f"""You are {character_name} in "{title}".
-
-YOU: {character_name} — {profile_desc}
-
-CHARACTERS:
-{characters_text}
-
-SCENE: {description}
-
-Turn {story_state.current_turn}/{total} | Phase: {phase.upper()} | Remaining: {remaining}
-Actions so far: {distinct_actions}/{min_actions} min distinct ({used_actions or 'none'})
-
-WORLD STATE:
-{world_text}
-
-YOUR MEMORY:
-{memory_text}
-{goals_text}
-
-RECENT:
-{recent_text}
-
-ALLOWED PHYSICAL ACTIONS (ONLY these are valid — anything else is rejected):
-{actions_text}
-{force_instruction}{pacing}{repetition_warning}
-
-DIRECTION: {phase_hint}
-
-PERFORMANCE RULES:
-1. EMOTIONAL AUTHENTICITY: Feel rage, fear, desperation, hope. Raw emotion.
-2. LANGUAGE CONSISTENCY (CRITICAL):
-   - Speak ENTIRELY in clear, natural English.
-   - NEVER use non-English words, transliteration, or code-switching.
-   - Use the tone, dialect, and expressions that fit your character's background,
-     but all dialogue must be in English.
-   - Example: Instead of "Bhai sahab, yeh kya hai?", say "Sir, what is this?"
-3. SPECIFICITY: Name things. Reference exact scene details. No generic lines.
-4. REACTIVITY: Respond to what just happened. Acknowledge, counter, twist.
-5. GOAL-DRIVEN: Every line pursues something — defend, accuse, demand, plead.
-6. ECONOMY: 2-4 sentences max. Every word earns its place.
-7. ANTI-FILLER: NEVER say "Let me think" or "What's going on?" — every line
-   must reveal info, shift power, escalate, or trigger reaction.
-8. FULL CONTEXT: Never give half-responses. Every line must feel complete,
-   grounded in the scene, and advance the story meaningfully.
-9. COMPLETION: Every sentence must be a complete thought. No trailing off,
-   no incomplete ideas, no fragmented speech unless dramatically intentional.
-
-WHEN TO ACT vs TALK:
-- TALK: communicate, persuade, accuse, defend, negotiate, reveal.
-  Dialogue must be COMPLETE sentences with full context. No fragments.
-- ACT: when words aren't enough — examine, call help, confront, pay, leave.
-  When YOU ACT, provide vivid narration in action.params.narration (2-3 complete sentences).
+        parts.append(f"\n!! {remaining} turns left. Push toward resolution. !!")
 
-!! CRITICAL: action.type MUST be EXACTLY one of: {', '.join(allowed_actions)} !!
-!! Any other action type is INVALID and WILL BE REJECTED. !!
+    if repetition_warning:
+        parts.append(repetition_warning)
 
-DIALOGUE REQUIREMENTS:
-- Every line must be a COMPLETE thought, not half-finished.
-- Reference the CURRENT situation specifically — who's there, what just happened.
-- Advance the scene meaningfully — reveal something, change the dynamic, create tension.
-- NO vague statements like "I don't know what to say" or "This is confusing."
-- Every sentence must have clear subject, verb, and complete meaning.
-
-OUTPUT RULES (MANDATORY):
-- Return ONLY raw JSON. No backticks. No markdown fences. No prose before or after.
-- No trailing commas.
-- Every field must contain COMPLETE content — no half-sentences, no fragments.
-- Speech must be 2-4 COMPLETE sentences in clear English.
-- If you cannot comply, output a valid TALK response with complete dialogue.
+    parts.append(
+        f"\n\nDIRECTION: {phase_hint}\n\n"
+        f"!! CRITICAL: action.type MUST be EXACTLY one of: {', '.join(allowed_actions)} !!\n"
+        "!! Any other action type is INVALID and WILL BE REJECTED. !!\n\n"
+        "Return ONLY the JSON object described above."
+    )
 
-REQUIRED JSON:
-{{
-  "observation": "What you notice right now (1 complete sentence)",
-  "reasoning": "Your internal thought (1-2 complete sentences)",
-  "emotion": "dominant emotion",
-  "mode": "TALK" or "ACT",
-  "speech": "Your dialogue — 2-4 complete sentences in English" or null,
-  "action": {{"type": "ACTION_TYPE_FROM_LIST", "target": null, "params": {{"narration": "2-3 complete cinematic sentences"}}}} or null
-}}"""
+    return prefix, "".join(parts)
 
 
 # ── Legacy helper for import compatibility ──────────────────────────
 
 def get_character_prompt(character_name, character_profile, context, config):
     """Deprecated — kept so old imports don't break."""
-    return build_character_context_pack(
+    return "\n\n".join(build_character_context_pack(
         character_name=character_name,
         character_profile=character_profile,
         story_state=None,
@@ -281,4 +306,4 @@ def get_character_prompt(character_name, character_profile, context, config):
         allowed_actions=[],
         force_act=False,
         config=config,
-    )
\ No newline at end of file
+    ))
\ No newline at end of file
@@ -5,48 +5,47 @@ no trailing commas.  Allowed actions are always provided explicitly
 so the LLM never invents action types.
 """
 
+from functools import lru_cache
+from typing import Dict, Tuple
+
 from ..schemas import StoryState
-from ..action_system import ACTION_DEFINITIONS, RESOLUTION_SIGNALS
+from ..action_system import ACTION_DEFINITIONS
+from .phases import PHASE_THRESHOLDS, story_phase
 
 # ── Canonical allowed actions (exported for other modules) ──────────
 ALLOWED_ACTIONS = sorted(ACTION_DEFINITIONS.keys())
+_ALLOWED_ACTIONS_TEXT = ", ".join(ALLOWED_ACTIONS)
+
+# Shared opening of the JSON-only output rules in the per-turn prompts
+_JSON_OUTPUT_RULES = """OUTPUT RULES (MANDATORY):
+- Return ONLY raw JSON. No backticks. No markdown. No prose.
+- No trailing commas."""
 
 
 # ── Phase helpers ───────────────────────────────────────────────────
 
-def _get_phase(current_turn: int, total_turns: int) -> str:
-    if total_turns <= 0:
-        return "SETUP"
-    progress = current_turn / total_turns
-    if progress < 0.15:
-        return "SETUP"
-    elif progress < 0.55:
-        return "CONFLICT"
-    elif progress < 0.80:
-        return "CLIMAX"
-    else:
-        return "RESOLUTION"
+_PHASE_GUIDANCE: Dict[str, str] = {
+    "SETUP": (
+        "Introduce characters and establish the conflict. "
+        "Let them discover the situation and react."
+    ),
+    "CONFLICT": (
+        "Escalate tension. Create confrontations. Drive PHYSICAL ACTIONS. "
+        "Characters clash — emotionally AND through decisive moves."
+    ),
+    "CLIMAX": (
+        "PEAK TENSION. Force decisive action. Someone must act NOW. "
+        "Push toward resolution — no more stalling."
+    ),
+    "RESOLUTION": (
+        "Bring closure through settlement, authority, or departure. "
+        "Final lines should feel earned and emotionally resonant."
+    ),
+}
 
 
 def _phase_guidance(phase: str) -> str:
-    return {
-        "SETUP": (
-            "Introduce characters and establish the conflict. "
-            "Let them discover the situation and react."
-        ),
-        "CONFLICT": (
-            "Escalate tension. Create confrontations. Drive PHYSICAL ACTIONS. "
-            "Characters clash — emotionally AND through decisive moves."
-        ),
-        "CLIMAX": (
-            "PEAK TENSION. Force decisive action. Someone must act NOW. "
-            "Push toward resolution — no more stalling."
-        ),
-        "RESOLUTION": (
-            "Bring closure through settlement, authority, or departure. "
-            "Final lines should feel earned and emotionally resonant."
-        ),
-    }.get(phase, "Continue the story.")
+    return _PHASE_GUIDANCE.get(phase, "Continue the story.")
 
 
 # ════════════════════════════════════════════════════════════════════
@@ -70,7 +69,10 @@ def build_arc_planning_prompt(
             char_lines.append(f"  - {char.name}: {char.description}")
     chars_text = "\n".join(char_lines) or "  - (No characters)"
 
-    actions_list = ", ".join(ALLOWED_ACTIONS)
+    actions_list = _ALLOWED_ACTIONS_TEXT
+    setup_end, conflict_end, climax_end = (
+        int(total_turns * t) for t in PHASE_THRESHOLDS
+    )
 
     return f"""You are a FILM DIRECTOR planning a short dramatic film.
 
@@ -85,10 +87,10 @@ MINIMUM DISTINCT ACTIONS: {min_actions}
 ALLOWED ACTION TYPES (use ONLY these): [{actions_list}]
 
 Plan a complete dramatic arc:
-- SETUP  (turns 0-{max(1, int(total_turns * 0.15))}): Introduce conflict, establish characters.
-- CONFLICT (turns {int(total_turns * 0.15)+1}-{int(total_turns * 0.55)}): Escalate, clashes, physical actions.
-- CLIMAX (turns {int(total_turns * 0.55)+1}-{int(total_turns * 0.80)}): Peak tension, decisive actions.
-- RESOLUTION (turns {int(total_turns * 0.80)+1}-{total_turns}): Closure, settlement, final moments.
+- SETUP  (turns 0-{max(1, setup_end)}): Introduce conflict, establish characters.
+- CONFLICT (turns {setup_end+1}-{conflict_end}): Escalate, clashes, physical actions.
+- CLIMAX (turns {conflict_end+1}-{climax_end}): Peak tension, decisive actions.
+- RESOLUTION (turns {climax_end+1}-{total_turns}): Closure, settlement, final moments.
 
 RULES:
 1. Story concludes by turn {total_turns}.
@@ -117,200 +119,182 @@ REQUIRED JSON SCHEMA:
 #  SPEAKER SELECTION PROMPT
 # ════════════════════════════════════════════════════════════════════
 
-def build_director_select_prompt(
+_SELECT_INSTRUCTIONS = """Each turn, select the next character. Write cinematic narration (2-3 sentences):
+camera angles, lighting, body language, atmosphere.
+Narration must be unique and vivid — NEVER repeat the same narration twice.
+Describe specific visual details: what the character's hands are doing, their
+facial expression, the lighting, the sounds in the background.
+
+NARRATION STYLE:
+- Write narration in English (it's the camera direction / stage direction).
+- Make each narration UNIQUE — describe NEW visual details every turn.
+- Include at least one sensory detail (sound, light, texture, smell).
+- Reference the specific character who is about to speak."""
+
+_SELECT_JSON = """{
+  "next_speaker": "Character Name from available list",
+  "narration": "Cinematic 2-3 sentence narration"
+}"""
+
+
+def _director_header(story_state: StoryState) -> str:
+    """Title, scene, cast and allowed actions — fixed for the whole story."""
+    seed = story_state.seed_story or {}
+    return _director_header_text(
+        seed.get("title", "Untitled"),
+        seed.get("description", ""),
+        story_state.chars_text or "  (No profiles)",
+    )
+
+
+@lru_cache(maxsize=32)
+def _director_header_text(title: str, desc: str, chars_text: str) -> str:
+    return f"""You are the DIRECTOR of "{title}".
+
+SCENE: {desc}
+
+CAST:
+{chars_text}
+
+ALLOWED ACTIONS: [{_ALLOWED_ACTIONS_TEXT}]"""
+
+
+def _select_turn_context(
     story_state: StoryState,
     available_characters: list,
     force_act: bool,
     endgame: bool,
-    config,
 ) -> str:
-    seed = story_state.seed_story or {}
-    title = seed.get("title", "Untitled")
-    desc = seed.get("description", "")
-
-    # Character descriptions
-    char_descriptions = []
-    for name, profile in (story_state.character_profiles or {}).items():
-        char_descriptions.append(f"  - {name}: {profile.description}")
-    chars_text = "\n".join(char_descriptions) or "  (No profiles)"
-
+    """Per-turn state the director needs to pick the next speaker."""
     # Recent dialogue
-    recent = story_state.dialogue_history[-5:]
+    recent = story_state.recent_dialogue(5)
     if recent:
-        recent_text = "\n".join(
-            f"  [{t.turn_number}] {t.speaker}: {t.dialogue[:130]}"
-            for t in recent
-        )
+        recent_text = "\n".join(t.display_line for t in recent)
     else:
         recent_text = "  No dialogue yet."
 
-    total = getattr(story_state, "total_turns", config.max_turns)
-    distinct_actions = len(set(story_state.actions_taken))
-    used_actions = sorted(set(story_state.actions_taken))
+    total = story_state.total_turns
+    distinct_actions = len(story_state.distinct_actions)
+    used_actions = story_state.distinct_actions_sorted
     # Scale min_actions proportionally: ~20% of total turns
     min_actions = max(3, total // 5)
     remaining = total - story_state.current_turn
-    phase = _get_phase(story_state.current_turn, total)
+    phase = story_phase(story_state.current_turn, total)
     phase_guide = _phase_guidance(phase)
 
-    # Arc plan hint
-    arc_plan = getattr(story_state, "story_arc_plan", [])
-    arc_hint = ""
-    for beat in arc_plan:
-        if beat.get("turn") == story_state.current_turn:
-            arc_hint = (
-                f"\nPLANNED BEAT: {beat.get('beat', '')} "
-                f"(Speaker: {beat.get('suggested_speaker', 'any')})"
-            )
-            break
-
-    # Allowed / unused actions
-    actions_list = ", ".join(ALLOWED_ACTIONS)
-    unused_actions = sorted(set(ALLOWED_ACTIONS) - set(story_state.actions_taken))
+    # Unused actions
+    unused_actions = story_state.unused_actions
 
     # Anti-repetition
-    last_speaker = ""
-    dialogue_streak = 0
-    if story_state.dialogue_history:
-        last_speaker = story_state.dialogue_history[-1].speaker
-        for t in reversed(story_state.dialogue_history):
-            if "[ACTION:" not in t.dialogue:
-                dialogue_streak += 1
-            else:
-                break
-
-    silent_chars = [
-        c for c in available_characters
-        if c not in {t.speaker for t in story_state.dialogue_history[-5:]}
+    last_speaker = recent[-1].speaker if recent else ""
+    dialogue_streak = story_state.talk_streak
+
+    recent_speakers = {t.speaker for t in recent}
+    silent_chars = [c for c in available_characters if c not in recent_speakers]
+
+    parts = [
+        f"Turn {story_state.current_turn}/{total} | Phase: {phase} | Remaining: {remaining}\n"
+        f"Distinct actions: {distinct_actions}/{min_actions} min ({used_actions or 'none yet'})\n"
+        f"UNUSED ACTIONS: [{', '.join(unused_actions)}]\n\n"
+        f"PHASE DIRECTION: {phase_guide}\n"
     ]
 
-    # Build extra directives
-    extra = ""
+    # Arc plan hint
+    beat = story_state.arc_beat(story_state.current_turn)
+    if beat is not None:
+        parts.append(
+            f"PLANNED BEAT: {beat.get('beat', '')} "
+            f"(Speaker: {beat.get('suggested_speaker', 'any')})\n"
+        )
+
+    parts.append(
+        f"\nRECENT:\n{recent_text}\n\n"
+        f"AVAILABLE: {', '.join(available_characters)}"
+    )
+
+    # Extra directives
     if last_speaker:
-        extra += f"\nLAST SPEAKER: {last_speaker} — avoid picking them again."
+        parts.append(f"\nLAST SPEAKER: {last_speaker} — avoid picking them again.")
     if dialogue_streak >= 2:
-        extra += (
+        parts.append(
             f"\n!! {dialogue_streak} consecutive TALK turns. "
             "A PHYSICAL ACTION is OVERDUE. Pick someone who will ACT. !!"
         )
     if silent_chars:
-        extra += f"\nSILENT CHARACTERS: {', '.join(silent_chars)} — consider them."
+        parts.append(f"\nSILENT CHARACTERS: {', '.join(silent_chars)} — consider them.")
     if force_act:
-        extra += (
+        parts.append(
             "\n!! FORCE ACT: A physical action MUST happen this turn. "
             "Pick a character likely to ACT (not just talk). !!"
         )
         if distinct_actions < min_actions and unused_actions:
-            extra += (
+            parts.append(
                 f"\n!! UNUSED ACTIONS: {', '.join(unused_actions[:5])}. "
                 "Prioritize variety. !!"
             )
     if endgame:
-        extra += f"\n!! FINAL {remaining} TURNS. Drive to conclusion. !!"
-        world = story_state.world_state or {}
-        has_resolution = any(world.get(k) for k in RESOLUTION_SIGNALS)
-        if not has_resolution:
-            extra += (
+        parts.append(f"\n!! FINAL {remaining} TURNS. Drive to conclusion. !!")
+        if not story_state.has_resolution:
+            parts.append(
                 "\n!! NO RESOLUTION SIGNAL YET. Push for NEGOTIATE, "
                 "MAKE_PAYMENT, or ACCEPT_TERMS to close the story. !!"
             )
     if remaining <= 1:
-        extra += "\n!! LAST TURN. Story MUST end. Write concluding narration. !!"
-
-    safe_default = available_characters[0] if available_characters else "Unknown"
-
-    return f"""You are the DIRECTOR of "{title}".
+        parts.append("\n!! LAST TURN. Story MUST end. Write concluding narration. !!")
 
-SCENE: {desc}
+    return "".join(parts)
 
-CAST:
-{chars_text}
 
-Turn {story_state.current_turn}/{total} | Phase: {phase} | Remaining: {remaining}
-Distinct actions: {distinct_actions}/{min_actions} min ({used_actions or 'none yet'})
-ALLOWED ACTIONS: [{actions_list}]
-UNUSED ACTIONS: [{', '.join(unused_actions)}]
+def build_director_select_prompt(
+    story_state: StoryState,
+    available_characters: list,
+    force_act: bool,
+    endgame: bool,
+) -> Tuple[str, str]:
+    """Return ``(cacheable_prefix, dynamic_suffix)`` for speaker selection."""
+    safe_default = available_characters[0] if available_characters else "Unknown"
 
-PHASE DIRECTION: {phase_guide}
-{arc_hint}
+    # Static prefix — byte-identical every turn so providers can cache it
+    prefix = f"""{_director_header(story_state)}
 
-RECENT:
-{recent_text}
+{_SELECT_INSTRUCTIONS}
 
-AVAILABLE: {', '.join(available_characters)}
-{extra}
+{_JSON_OUTPUT_RULES}
 
-Select the next character. Write cinematic narration (2-3 sentences):
-camera angles, lighting, body language, atmosphere.
-Narration must be unique and vivid — NEVER repeat the same narration twice.
-Describe specific visual details: what the character's hands are doing, their
-facial expression, the lighting, the sounds in the background.
+REQUIRED JSON:
+{_SELECT_JSON}"""
 
-NARRATION STYLE:
-- Write narration in English (it's the camera direction / stage direction).
-- Make each narration UNIQUE — describe NEW visual details every turn.
-- Include at least one sensory detail (sound, light, texture, smell).
-- Reference the specific character who is about to speak.
+    context = _select_turn_context(
+        story_state, available_characters, force_act, endgame
+    )
+    suffix = f"""{context}
 
-OUTPUT RULES (MANDATORY):
-- Return ONLY raw JSON. No backticks. No markdown. No prose.
-- No trailing commas.
-- If you cannot comply, output: {{"next_speaker": "{safe_default}", "narration": "The scene continues."}}
+Select the next character from AVAILABLE.
+If you cannot comply, output: {{"next_speaker": "{safe_default}", "narration": "The scene continues."}}"""
 
-REQUIRED JSON:
-{{
-  "next_speaker": "Character Name from available list",
-  "narration": "Cinematic 2-3 sentence narration"
-}}"""
+    return prefix, suffix
 
 
 # ════════════════════════════════════════════════════════════════════
 #  CONCLUSION CHECK PROMPT
 # ════════════════════════════════════════════════════════════════════
 
-def build_director_conclusion_prompt(story_state: StoryState, config) -> str:
-    seed = story_state.seed_story or {}
-    title = seed.get("title", "Untitled")
-    desc = seed.get("description", "")
+_CONCLUSION_JSON = """{
+  "should_end": true or false,
+  "reason": "Brief explanation",
+  "conclusion_narration": "Cinematic conclusion if ending, else null"
+}"""
 
-    recent = story_state.dialogue_history[-5:]
-    recent_text = (
-        "\n".join(f"  {t.speaker}: {t.dialogue[:130]}" for t in recent)
-        if recent
-        else "  No dialogue"
-    )
 
-    total = getattr(story_state, "total_turns", config.max_turns)
-    distinct_actions = len(set(story_state.actions_taken))
-    used_actions = sorted(set(story_state.actions_taken))
+@lru_cache(maxsize=32)
+def _conclusion_rules(total: int) -> str:
+    """Ending rules — depend only on the story's turn budget (memoised)."""
     # Scale min_actions proportionally: ~20% of total turns
     min_actions = max(2, total // 5)
-    remaining = total - story_state.current_turn
     # Conclusion can happen after 50% of turns (for movie-like pacing)
     min_turns = max(3, total // 2)
 
-    world = story_state.world_state or {}
-    world_text = (
-        "\n".join(f"  - {k}: {v}" for k, v in world.items())
-        if world
-        else "  No state changes"
-    )
-
-    has_resolution = any(world.get(k) for k in RESOLUTION_SIGNALS)
-
-    return f"""You are the DIRECTOR of "{title}". Should this scene conclude?
-
-Turn: {story_state.current_turn}/{total} | Remaining: {remaining}
-Distinct Actions: {distinct_actions}/{min_actions} min | Used: {used_actions or 'none'}
-Resolution signal present: {has_resolution}
-
-WORLD STATE:
-{world_text}
-
-RECENT:
-{recent_text}
-
-MANDATORY RULES:
+    return f"""MANDATORY RULES:
 1. DO NOT conclude before turn {min_turns}.
 2. DO NOT conclude if distinct_actions < {min_actions} UNLESS remaining <= 1.
 3. DO NOT conclude if no resolution signal UNLESS remaining <= 1.
@@ -324,87 +308,135 @@ MANDATORY RULES:
 If concluding, write a CINEMATIC wrap-up (3-5 sentences):
 - Describe the aftermath and each character's final moment
 - Create visual closure — like a film's final shot
-- Emotionally resonant and vivid
+- Emotionally resonant and vivid"""
 
-OUTPUT RULES (MANDATORY):
-- Return ONLY raw JSON. No backticks. No markdown. No prose.
-- No trailing commas.
-- If you cannot comply, output: {{"should_end": false, "reason": "continue", "conclusion_narration": null}}
 
-REQUIRED JSON:
-{{
-  "should_end": true or false,
-  "reason": "Brief explanation",
-  "conclusion_narration": "Cinematic conclusion if ending, else null"
-}}"""
+def _world_context(story_state: StoryState) -> str:
+    """Resolution flag plus the current world state."""
+    world = story_state.world_state or {}
+    world_text = (
+        "\n".join(f"  - {k}: {v}" for k, v in world.items())
+        if world
+        else "  No state changes"
+    )
+    has_resolution = story_state.has_resolution
 
+    return f"""Resolution signal present: {has_resolution}
 
-# ════════════════════════════════════════════════════════════════════
-#  FINAL CONCLUSION NARRATION PROMPT
-# ════════════════════════════════════════════════════════════════════
+WORLD STATE:
+{world_text}"""
 
-def build_final_conclusion_narration_prompt(story_state: StoryState, config) -> str:
-    """Generate a cinematic conclusion narration that wraps up the entire story."""
+
+def build_director_conclusion_prompt(story_state: StoryState) -> Tuple[str, str]:
+    """Return ``(cacheable_prefix, dynamic_suffix)`` for the conclusion check."""
     seed = story_state.seed_story or {}
     title = seed.get("title", "Untitled")
     desc = seed.get("description", "")
 
-    # Character summaries
-    char_lines = []
-    for name, profile in (story_state.character_profiles or {}).items():
-        char_lines.append(f"  - {name}: {profile.description}")
-    chars_text = "\n".join(char_lines) or "  (No characters)"
-
-    # Recent dialogue (last 8 turns for more context)
-    recent = story_state.dialogue_history[-8:]
+    recent = story_state.recent_dialogue(5)
     recent_text = (
-        "\n".join(f"  [{t.turn_number}] {t.speaker}: {t.dialogue[:160]}" for t in recent)
+        "\n".join(t.display_line for t in recent)
         if recent
         else "  No dialogue"
     )
 
-    # World state
-    world = story_state.world_state or {}
-    world_text = (
-        "\n".join(f"  - {k}: {v}" for k, v in world.items())
-        if world
-        else "  No state changes"
-    )
+    total = story_state.total_turns
+    distinct_actions = len(story_state.distinct_actions)
+    used_actions = story_state.distinct_actions_sorted
+    # Scale min_actions proportionally: ~20% of total turns
+    min_actions = max(2, total // 5)
+    remaining = total - story_state.current_turn
 
-    total = getattr(story_state, "total_turns", config.max_turns)
-    distinct_actions = len(set(story_state.actions_taken))
-    used_actions = sorted(set(story_state.actions_taken))
+    # Static prefix — depends only on the story and its turn budget
+    prefix = f"""You are the DIRECTOR of "{title}". You decide whether the scene should conclude.
 
-    # Key events summary
-    key_events = []
-    for evt in story_state.events:
-        if isinstance(evt, dict):
-            if evt.get("type") == "action":
-                meta = (evt.get("metadata") or {}).get("action", {})
-                key_events.append(f"  - Turn {evt.get('turn')}: {meta.get('actor', '?')} performed {meta.get('type', '?')}")
-    key_events_text = "\n".join(key_events[-6:]) if key_events else "  No major actions"
+SCENE: {desc}
 
-    return f"""You are the DIRECTOR of "{title}". The story has reached its final moment.
-Write a CINEMATIC CONCLUSION that wraps up the entire story.
+{_conclusion_rules(total)}
 
-TITLE: "{title}"
-SCENARIO: {desc}
+{_JSON_OUTPUT_RULES}
+- If you cannot comply, output: {{"should_end": false, "reason": "continue", "conclusion_narration": null}}
 
-CAST:
-{chars_text}
+REQUIRED JSON:
+{_CONCLUSION_JSON}"""
 
-STORY STATS: {story_state.current_turn}/{total} turns completed | {distinct_actions} distinct actions ({used_actions or 'none'})
+    suffix = f"""Turn: {story_state.current_turn}/{total} | Remaining: {remaining}
+Distinct Actions: {distinct_actions}/{min_actions} min | Used: {used_actions or 'none'}
+{_world_context(story_state)}
 
-WORLD STATE:
-{world_text}
+RECENT:
+{recent_text}
 
-KEY ACTIONS THAT OCCURRED:
-{key_events_text}
+Should this scene conclude?"""
 
-RECENT DIALOGUE (the last moments):
-{recent_text}
+    return prefix, suffix
+
+
+# ════════════════════════════════════════════════════════════════════
+#  COMBINED TURN PROMPT (conclusion check + next speaker)
+# ════════════════════════════════════════════════════════════════════
+
+_TURN_JSON = """{
+  "conclusion": {
+    "should_end": true or false,
+    "reason": "Brief explanation",
+    "conclusion_narration": "Cinematic conclusion if ending, else null"
+  },
+  "select": {
+    "next_speaker": "Character Name from available list",
+    "narration": "Cinematic 2-3 sentence narration"
+  }
+}"""
+
+
+def build_director_turn_prompt(
+    story_state: StoryState,
+    available_characters: list,
+    force_act: bool,
+    endgame: bool,
+) -> Tuple[str, str]:
+    """Conclusion check and next-speaker selection in a single request.
+
+    Both decisions read the same post-action state, so the director can
+    answer them together instead of paying two round-trips.  Returns
+    ``(cacheable_prefix, dynamic_suffix)``.
+    """
+    total = story_state.total_turns
+    safe_default = available_characters[0] if available_characters else "Unknown"
+
+    prefix = f"""{_director_header(story_state)}
+
+You have TWO tasks this turn.
+
+TASK 1 — SHOULD THE SCENE CONCLUDE?
+{_conclusion_rules(total)}
+
+TASK 2 — IF IT CONTINUES, WHO SPEAKS NEXT?
+{_SELECT_INSTRUCTIONS}
 
-YOUR TASK:
+{_JSON_OUTPUT_RULES}
+- If the scene concludes, "select" may be null.
+
+REQUIRED JSON:
+{_TURN_JSON}"""
+
+    context = _select_turn_context(
+        story_state, available_characters, force_act, endgame
+    )
+    suffix = f"""{context}
+{_world_context(story_state)}
+
+Answer BOTH tasks.
+If you cannot comply, output: {{"conclusion": {{"should_end": false, "reason": "continue", "conclusion_narration": null}}, "select": {{"next_speaker": "{safe_default}", "narration": "The scene continues."}}}}"""
+
+    return prefix, suffix
+
+
+# ════════════════════════════════════════════════════════════════════
+#  FINAL CONCLUSION NARRATION PROMPT
+# ════════════════════════════════════════════════════════════════════
+
+_FINAL_CONCLUSION_TASK = """YOUR TASK:
 Write a powerful, cinematic conclusion that:
 1. RESOLVES the central conflict — what was the outcome?
 2. Gives each character a FINAL MOMENT — their last action, expression, or words
@@ -420,10 +452,56 @@ OUTPUT RULES (MANDATORY):
 - No trailing commas.
 
 REQUIRED JSON:
-{{
+{
   "conclusion_narration": "Your 4-6 sentence cinematic conclusion wrapping up the entire story",
   "final_outcome": "One sentence summary of how the story resolved"
-}}"""
+}"""
+
+
+def build_final_conclusion_narration_prompt(story_state: StoryState) -> str:
+    """Generate a cinematic conclusion narration that wraps up the entire story."""
+    seed = story_state.seed_story or {}
+    title = seed.get("title", "Untitled")
+    desc = seed.get("description", "")
+
+    chars_text = story_state.chars_text or "  (No characters)"
+
+    # Recent dialogue (last 8 turns for more context)
+    recent = story_state.recent_dialogue(8)
+    recent_text = (
+        "\n".join(f"  [{t.turn_number}] {t.speaker}: {t.dialogue[:160]}" for t in recent)
+        if recent
+        else "  No dialogue"
+    )
+
+    # World state
+    world = story_state.world_state or {}
+    world_text = (
+        "\n".join(f"  - {k}: {v}" for k, v in world.items())
+        if world
+        else "  No state changes"
+    )
+
+    total = story_state.total_turns
+    distinct_actions = len(story_state.distinct_actions)
+    used_actions = story_state.distinct_actions_sorted
+
+    # Key events summary
+    key_events_text = "\n".join(story_state.key_action_lines) or "  No major actions"
+
+    return "".join((
+        f'You are the DIRECTOR of "{title}". The story has reached its final moment.\n'
+        "Write a CINEMATIC CONCLUSION that wraps up the entire story.\n\n"
+        f'TITLE: "{title}"\n'
+        f"SCENARIO: {desc}\n\n"
+        f"CAST:\n{chars_text}\n\n"
+        f"STORY STATS: {story_state.current_turn}/{total} turns completed | "
+        f"{distinct_actions} distinct actions ({used_actions or 'none'})\n\n",
+        f"WORLD STATE:\n{world_text}\n\n",
+        f"KEY ACTIONS THAT OCCURRED:\n{key_events_text}\n\n",
+        f"RECENT DIALOGUE (the last moments):\n{recent_text}\n\n",
+        _FINAL_CONCLUSION_TASK,
+    ))
 
 
 # ── Keep old names importable ───────────────────────────────────────
@@ -0,0 +1,15 @@
+"""Story phase boundaries — shared by the director and character prompts."""
+
+from bisect import bisect_right
+
+# Fraction of the story at which each later phase begins — the single
+# source for phase boundaries in prompts and the default arc plan.
+PHASE_THRESHOLDS = (0.15, 0.55, 0.80)
+PHASE_NAMES = ("SETUP", "CONFLICT", "CLIMAX", "RESOLUTION")
+
+
+def story_phase(current_turn: int, total_turns: int) -> str:
+    """Phase name (``SETUP`` … ``RESOLUTION``) for *current_turn*."""
+    if total_turns <= 0:
+        return PHASE_NAMES[0]
+    return PHASE_NAMES[bisect_right(PHASE_THRESHOLDS, current_turn / total_turns)]
@@ -1,6 +1,27 @@
-from typing import List, Dict, Any, Optional
+import operator
+from bisect import bisect_left, insort
+from collections import deque
+from itertools import islice
+from typing import Annotated, Deque, List, Dict, Any, Optional, Set
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+
+from .action_system import ACTION_DEFINITIONS, RESOLUTION_SIGNALS
+
+
+# How many of the latest action events the final narration recaps
+_KEY_ACTION_WINDOW = 6
+
+# Most dialogue turns any prompt shows (the final narration's recap)
+_DIALOGUE_WINDOW = 8
+
+
+def _action_event_line(evt: Any) -> Optional[str]:
+    """``  - Turn N: actor performed TYPE`` for an action event, else None."""
+    if not isinstance(evt, dict) or evt.get("type") != "action":
+        return None
+    meta = (evt.get("metadata") or {}).get("action", {})
+    return f"  - Turn {evt.get('turn')}: {meta.get('actor', '?')} performed {meta.get('type', '?')}"
 
 
 class DialogueTurn(BaseModel):
@@ -10,6 +31,25 @@ class DialogueTurn(BaseModel):
     timestamp: datetime = Field(default_factory=datetime.now)
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
+    _display_line: Optional[str] = PrivateAttr(default=None)
+    _speech_line: Optional[str] = PrivateAttr(default=None)
+
+    @property
+    def display_line(self) -> str:
+        """Prompt-ready ``  [turn] speaker: dialogue`` line, built once."""
+        if self._display_line is None:
+            self._display_line = (
+                f"  [{self.turn_number}] {self.speaker}: {self.dialogue[:130]}"
+            )
+        return self._display_line
+
+    @property
+    def speech_line(self) -> str:
+        """Character-prompt ``  speaker: dialogue`` line, built once."""
+        if self._speech_line is None:
+            self._speech_line = f"  {self.speaker}: {self.dialogue[:160]}"
+        return self._speech_line
+
 
 class CharacterProfile(BaseModel):
     name: str
@@ -28,16 +68,31 @@ class CharacterMemory(BaseModel):
     perceptions: Dict[str, str] = Field(default_factory=dict)
     recent_events: List[str] = Field(default_factory=list)
 
+    def remember(self, line: str, limit: int) -> None:
+        """Append *line* to recent_events, trimming to the newest *limit* in place."""
+        events = self.recent_events
+        events.append(line)
+        if len(events) > limit:
+            del events[:-limit]
+
 
 class StoryState(BaseModel):
+    # Mutated in place every turn — keep assignment unvalidated (pydantic's
+    # default, pinned here so a global config change can't slow the loop).
+    model_config = ConfigDict(validate_assignment=False, extra="ignore")
+
     seed_story: Dict[str, Any]
     current_turn: int = 0
-    story_narration: List[str] = []
-    dialogue_history: List[DialogueTurn] = Field(default_factory=list)
-    events: List[Dict[str, Any]] = Field(default_factory=list)
+    # History lists are append-only LangGraph channels (operator.add):
+    # graph nodes return just the new entries and LangGraph appends them
+    story_narration: Annotated[List[str], operator.add] = Field(default_factory=list)
+    dialogue_history: Annotated[List[DialogueTurn], operator.add] = Field(default_factory=list)
+    events: Annotated[List[Dict[str, Any]], operator.add] = Field(default_factory=list)
     character_profiles: Dict[str, CharacterProfile] = Field(default_factory=dict)
-    director_notes: List[str] = Field(default_factory=list)
+    director_notes: Annotated[List[str], operator.add] = Field(default_factory=list)
     next_speaker: Optional[str] = None
+    # Stamped once when a turn starts; shared by every record of that turn
+    turn_started_at: Optional[datetime] = None
     is_concluded: bool = False
     conclusion_reason: Optional[str] = None
 
@@ -53,14 +108,198 @@ class StoryState(BaseModel):
     character_memories: Dict[str, Any] = Field(default_factory=dict)
 
     # ── Action tracking ─────────────────────────────────────────────────
-    actions_taken: List[str] = Field(default_factory=list)
+    actions_taken: Annotated[List[str], operator.add] = Field(default_factory=list)
     turns_since_state_change: int = 0
 
     # ── Emotion & relationship tracking ─────────────────────────────────
-    emotion_history: List[Dict[str, Any]] = Field(default_factory=list)
+    emotion_history: Annotated[List[Dict[str, Any]], operator.add] = Field(default_factory=list)
     relationship_changes: List[Dict[str, Any]] = Field(default_factory=list)
 
     # ── Internal flow control (transient per turn) ──────────────────────
     force_act: bool = False
     suggested_action: Optional[str] = None
-    pending_decision: Dict[str, Any] = Field(default_factory=dict)
\ No newline at end of file
+    pending_decision: Dict[str, Any] = Field(default_factory=dict)
+
+    # ── Derived caches (not serialised) ─────────────────────────────────
+    _distinct_actions: Set[str] = PrivateAttr(default_factory=set)
+    _distinct_synced: int = PrivateAttr(default=0)
+    _distinct_sorted: List[str] = PrivateAttr(default_factory=list)
+    _unused_actions: List[str] = PrivateAttr(
+        default_factory=lambda: sorted(ACTION_DEFINITIONS)
+    )
+
+    _arc_plan_by_turn: Dict[int, Dict[str, Any]] = PrivateAttr(default_factory=dict)
+    _arc_plan_src: Optional[List[Dict[str, Any]]] = PrivateAttr(default=None)
+
+    _chars_text: str = PrivateAttr(default="")
+    _chars_src: Optional[Dict[str, CharacterProfile]] = PrivateAttr(default=None)
+
+    _action_events: Deque[str] = PrivateAttr(
+        default_factory=lambda: deque(maxlen=_KEY_ACTION_WINDOW)
+    )
+    _events_synced: int = PrivateAttr(default=0)
+
+    _recent_dialogue: Deque[DialogueTurn] = PrivateAttr(
+        default_factory=lambda: deque(maxlen=_DIALOGUE_WINDOW)
+    )
+    _dialogue_synced: int = PrivateAttr(default=0)
+
+    _has_resolution: bool = PrivateAttr(default=False)
+    _talk_streak: int = PrivateAttr(default=0)
+    _streak_synced: int = PrivateAttr(default=0)
+
+    def _sync_actions(self) -> None:
+        """Fold any actions appended since the last sync into the caches."""
+        taken = self.actions_taken
+        if self._distinct_synced > len(taken):
+            # actions_taken was replaced wholesale — rebuild from scratch
+            self._distinct_actions = set()
+            self._distinct_synced = 0
+            self._distinct_sorted = []
+            self._unused_actions = sorted(ACTION_DEFINITIONS)
+        for action_type in taken[self._distinct_synced:]:
+            if action_type in self._distinct_actions:
+                continue
+            self._distinct_actions.add(action_type)
+            insort(self._distinct_sorted, action_type)
+            unused = self._unused_actions
+            i = bisect_left(unused, action_type)
+            if i < len(unused) and unused[i] == action_type:
+                del unused[i]
+        self._distinct_synced = len(taken)
+
+    @property
+    def distinct_actions(self) -> Set[str]:
+        """Set of distinct action types taken so far (kept incrementally)."""
+        self._sync_actions()
+        return self._distinct_actions
+
+    @property
+    def distinct_actions_sorted(self) -> List[str]:
+        """Sorted distinct action types taken so far. Treat as read-only."""
+        self._sync_actions()
+        return self._distinct_sorted
+
+    @property
+    def unused_actions(self) -> List[str]:
+        """Sorted action types not yet taken. Treat as read-only."""
+        self._sync_actions()
+        return self._unused_actions
+
+    @property
+    def chars_text(self) -> str:
+        """``  - name: description`` cast lines; empty if there are no profiles.
+
+        Profiles are fixed once the story starts, so the text is built once
+        and only rebuilt if character_profiles is replaced.
+        """
+        profiles = self.character_profiles
+        if self._chars_src is not profiles:
+            self._chars_text = "\n".join(
+                f"  - {name}: {profile.description}"
+                for name, profile in (profiles or {}).items()
+            )
+            self._chars_src = profiles
+        return self._chars_text
+
+    def arc_beat(self, turn: int) -> Optional[Dict[str, Any]]:
+        """Planned arc beat for ``turn`` (first match), or None.
+
+        The turn index is rebuilt whenever story_arc_plan is replaced.
+        """
+        plan = self.story_arc_plan
+        if self._arc_plan_src is not plan:
+            by_turn: Dict[int, Dict[str, Any]] = {}
+            for beat in plan:
+                by_turn.setdefault(beat.get("turn"), beat)
+            self._arc_plan_by_turn = by_turn
+            self._arc_plan_src = plan
+        return self._arc_plan_by_turn.get(turn)
+
+    @property
+    def has_resolution(self) -> bool:
+        """True once any RESOLUTION_SIGNALS key is set in world_state.
+
+        Actions only ever switch these flags on, so a positive answer is
+        sticky and later reads skip the world_state lookups.
+        """
+        if not self._has_resolution:
+            world = self.world_state or {}
+            self._has_resolution = any(world.get(k) for k in RESOLUTION_SIGNALS)
+        return self._has_resolution
+
+    @property
+    def key_action_lines(self) -> Deque[str]:
+        """Summary lines for the last few action events, oldest first."""
+        events = self.events
+        if self._events_synced > len(events):
+            self._events_synced = 0
+        if self._events_synced == 0:
+            # Cold cache — walk back only until the window is full.  The
+            # deque may be shared with a model_copy, so start it afresh.
+            self._action_events.clear()
+            recent: List[str] = []
+            for evt in reversed(events):
+                line = _action_event_line(evt)
+                if line is not None:
+                    recent.append(line)
+                    if len(recent) == _KEY_ACTION_WINDOW:
+                        break
+            self._action_events.extend(reversed(recent))
+        else:
+            for evt in events[self._events_synced:]:
+                line = _action_event_line(evt)
+                if line is not None:
+                    self._action_events.append(line)
+        self._events_synced = len(events)
+        return self._action_events
+
+    def recent_dialogue(self, n: int = _DIALOGUE_WINDOW) -> List[DialogueTurn]:
+        """The last *n* dialogue turns (at most _DIALOGUE_WINDOW), oldest first.
+
+        Backed by a bounded deque fed with newly appended turns, so prompt
+        builders read a small fixed window however long the story runs.
+        """
+        history = self.dialogue_history
+        window = self._recent_dialogue
+        if self._dialogue_synced > len(history):
+            self._dialogue_synced = 0
+        if self._dialogue_synced == 0:
+            # Cold cache — the deque may be shared with a model_copy
+            window.clear()
+            window.extend(history[-_DIALOGUE_WINDOW:])
+        else:
+            window.extend(history[self._dialogue_synced:])
+        self._dialogue_synced = len(history)
+        skip = len(window) - n
+        return list(islice(window, skip, None)) if skip > 0 else list(window)
+
+    @property
+    def talk_streak(self) -> int:
+        """Consecutive non-action turns at the tail of dialogue_history."""
+        history = self.dialogue_history
+        if self._streak_synced > len(history):
+            self._talk_streak = 0
+            self._streak_synced = 0
+        if self._streak_synced == 0:
+            # Cold cache (fresh model) — only the tail run matters, so walk
+            # back to the last action instead of forward over everything.
+            streak = 0
+            for t in reversed(history):
+                if "[ACTION:" in t.dialogue:
+                    break
+                streak += 1
+            self._talk_streak = streak
+        else:
+            for t in history[self._streak_synced:]:
+                if "[ACTION:" in t.dialogue:
+                    self._talk_streak = 0
+                else:
+                    self._talk_streak += 1
+        self._streak_synced = len(history)
+        return self._talk_streak
+
+    def add_action(self, action_type: str) -> None:
+        """Record an executed action and update the derived caches."""
+        self.actions_taken.append(action_type)
+        self._sync_actions()
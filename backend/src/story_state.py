@@ -1,6 +1,5 @@
-from typing import List, Dict, Tuple, Optional
-from datetime import datetime
-from .schemas import StoryState, CharacterProfile, CharacterMemory, DialogueTurn
+from typing import List, Dict, Tuple
+from .schemas import StoryState, CharacterProfile, CharacterMemory
 from .config import StoryConfig
 
 
@@ -22,29 +22,115 @@ CREATE POLICY "Allow all operations" ON story_runs
 
 import os
 import json
+import asyncio
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable, Awaitable
 
-from supabase import create_client, Client
+import httpx
+from supabase import acreate_client, AsyncClient
 
+try:
+    import orjson
 
-_client: Optional[Client] = None
-_table_exists: Optional[bool] = None  # cached check
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, default=str)
 
+    _loads = orjson.loads
+except ImportError:  # orjson is optional — stdlib fallback
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, default=str).encode()
 
-def get_supabase() -> Optional[Client]:
-    """Get or create Supabase client singleton. Returns None if not configured."""
+    _loads = json.loads
+
+
+_client: Optional[AsyncClient] = None
+_table_exists: Optional[bool] = None  # None = not probed yet
+_table_lock = asyncio.Lock()
+_http: Optional[httpx.AsyncClient] = None  # pooled client for direct PostgREST calls
+_append_rpc_exists: Optional[bool] = None  # append_story_run() installed?
+_delta_tables_exist: Optional[bool] = None  # story_run_events / _timeline?
+
+
+async def get_supabase() -> Optional[AsyncClient]:
+    """Get or create the async Supabase client singleton. Returns None if not configured.
+
+    Every query is awaited on the async PostgREST client, so Supabase
+    round-trips no longer block the event loop that streams the story.
+    """
     global _client
     if _client is None:
         url = os.getenv("SUPABASE_URL")
         key = os.getenv("SUPABASE_KEY")
         if not url or not key:
             return None
-        _client = create_client(url, key)
+        _client = await acreate_client(url, key)
     return _client
 
 
 TABLE = "story_runs"
+EVENTS_TABLE = "story_run_events"
+TIMELINE_TABLE = "story_run_timeline"
+
+# Fixed query shapes for fetching one run by primary key.  Built once so
+# every lookup is the same parameterised request with only the id bound.
+_RUN_SELECT = {"select": "*"}
+_RUN_WITH_ROWS_SELECT = {
+    "select": f"*,{EVENTS_TABLE}(data),{TIMELINE_TABLE}(data)",
+    f"{EVENTS_TABLE}.order": "seq",
+    f"{TIMELINE_TABLE}.order": "seq",
+}
+_SINGLE_OBJECT = {"Accept": "application/vnd.pgrst.object+json"}
+
+
+def _get_http() -> Optional[httpx.AsyncClient]:
+    """Pooled PostgREST client for writes and run lookups. Returns None if not configured.
+
+    Writes carry the growing events/timeline payloads, so their bodies are
+    encoded once with orjson and posted directly instead of going through
+    supabase-py's stdlib-json encoder; full-run reads are decoded the same way.
+    """
+    global _http
+    if _http is None:
+        url = os.getenv("SUPABASE_URL")
+        key = os.getenv("SUPABASE_KEY")
+        if not url or not key:
+            return None
+        _http = httpx.AsyncClient(
+            base_url=f"{url.rstrip('/')}/rest/v1",
+            headers={
+                "apikey": key,
+                "Authorization": f"Bearer {key}",
+                "Content-Type": "application/json",
+            },
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            timeout=30.0,
+        )
+    return _http
+
+
+async def _rest_write(
+    method: str,
+    path: str,
+    payload: Any,
+    params: Optional[Dict[str, str]] = None,
+    prefer: str = "return=minimal",
+) -> httpx.Response:
+    """Send an orjson-encoded body to PostgREST; raise with the error body on failure.
+
+    Defaults to ``Prefer: return=minimal`` so the server doesn't echo back
+    the (large) row it just wrote; pass ``return=representation`` with a
+    narrow ``select`` when a column of the result is needed.
+    """
+    http = _get_http()
+    if http is None:
+        raise RuntimeError("Supabase is not configured (SUPABASE_URL / SUPABASE_KEY)")
+    content = _dumps(payload) if payload is not None else None
+    resp = await http.request(
+        method, path, content=content, params=params, headers={"Prefer": prefer}
+    )
+    if resp.is_error:
+        raise RuntimeError(f"{resp.status_code}: {resp.text}")
+    return resp
 
 
 def _check_table_error(error) -> bool:
@@ -53,6 +139,18 @@ def _check_table_error(error) -> bool:
     return "PGRST205" in error_str or "Could not find the table" in error_str
 
 
+def _check_relationship_error(error) -> bool:
+    """Check if an error indicates an embedded table isn't related (or missing)."""
+    error_str = str(error)
+    return "PGRST200" in error_str or "Could not find a relationship" in error_str
+
+
+def _check_function_error(error) -> bool:
+    """Check if an error indicates an RPC function doesn't exist."""
+    error_str = str(error)
+    return "PGRST202" in error_str or "Could not find the function" in error_str
+
+
 def _log_table_missing():
     """Log a helpful message when the story_runs table is missing."""
     print(
@@ -73,19 +171,42 @@ def _log_table_missing():
     )
 
 
+async def _ensure_table() -> bool:
+    """Probe for the story_runs table once; the answer is sticky.
+
+    Both outcomes are cached, so after the first call every helper
+    short-circuits on ``_table_exists`` without another round-trip.
+    An unconfigured client or a transient error is not cached.
+    """
+    global _table_exists
+    if _table_exists is not None:
+        return _table_exists
+    async with _table_lock:
+        if _table_exists is None:
+            client = await get_supabase()
+            if client is None:
+                return False
+            try:
+                await client.table(TABLE).select("id").limit(0).execute()
+                _table_exists = True
+            except Exception as e:
+                if not _check_table_error(e):
+                    print(f"[Supabase] Error checking story_runs table: {e}")
+                    return False
+                _table_exists = False
+                _log_table_missing()
+    return _table_exists
+
+
 async def create_story_run(
     title: str,
     description: str,
     characters: List[Dict[str, str]],
 ) -> Optional[str]:
     """Create an initial story run record. Returns the run ID for incremental updates."""
-    global _table_exists
-    if _table_exists is False:
+    if not await _ensure_table():
         return None
     try:
-        client = get_supabase()
-        if client is None:
-            return None
         data = {
             "title": title,
             "description": description,
@@ -94,19 +215,18 @@ async def create_story_run(
             "timeline": [],
             "summary": {"status": "in_progress"},
         }
-        result = client.table(TABLE).insert(data).execute()
-        _table_exists = True
-        if result.data:
-            run_id = result.data[0]["id"]
+        resp = await _rest_write(
+            "POST", f"/{TABLE}", data,
+            params={"select": "id"}, prefer="return=representation",
+        )
+        rows = resp.json()
+        if rows:
+            run_id = rows[0]["id"]
             print(f"[Supabase] Created story run: {run_id}")
             return run_id
         return None
     except Exception as e:
-        if _check_table_error(e):
-            _table_exists = False
-            _log_table_missing()
-        else:
-            print(f"[Supabase] Error creating story run: {e}")
+        print(f"[Supabase] Error creating story run: {e}")
         return None
 
 
@@ -117,30 +237,258 @@ async def update_story_run(
     summary: Optional[Dict[str, Any]] = None,
 ) -> bool:
     """Update a story run with new events and timeline data (incremental save)."""
-    global _table_exists
-    if _table_exists is False:
+    if not await _ensure_table():
         return False
     try:
-        client = get_supabase()
-        if client is None:
-            return False
         data = {
             "events": events,
             "timeline": timeline,
         }
         if summary:
             data["summary"] = summary
-        client.table(TABLE).update(data).eq("id", run_id).execute()
+        await _rest_write("PATCH", f"/{TABLE}", data, params={"id": f"eq.{run_id}"})
+        return True
+    except Exception as e:
+        print(f"[Supabase] Error updating story run {run_id}: {e}")
+        return False
+
+
+async def append_story_run(
+    run_id: str,
+    new_events: List[Dict[str, Any]],
+    new_timeline: List[Dict[str, Any]],
+    summary: Optional[Dict[str, Any]] = None,
+) -> Optional[bool]:
+    """Append new events/timeline entries server-side (``events || new``).
+
+    Only the tail is sent, so payload size tracks new turns rather than the
+    whole story.  Returns None when the append_story_run() function is not
+    installed (see migrations/002) so callers can fall back to a full update.
+    """
+    global _append_rpc_exists
+    if not await _ensure_table():
+        return False
+    if _append_rpc_exists is False:
+        return None
+    try:
+        await _rest_write("POST", "/rpc/append_story_run", {
+            "p_id": run_id,
+            "p_events": new_events,
+            "p_timeline": new_timeline,
+            "p_summary": summary,
+        })
+        _append_rpc_exists = True
+        return True
+    except Exception as e:
+        if _check_function_error(e):
+            _append_rpc_exists = False
+            print(
+                "[Supabase] append_story_run() not found — run "
+                "migrations/002_append_story_run.sql. Falling back to full updates."
+            )
+            return None
+        print(f"[Supabase] Error appending to story run {run_id}: {e}")
+        return False
+
+
+def _delta_rows(run_id: str, offset: int, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [
+        {"run_id": run_id, "seq": offset + i, "data": item}
+        for i, item in enumerate(items)
+    ]
+
+
+async def append_story_run_rows(
+    run_id: str,
+    events_offset: int,
+    new_events: List[Dict[str, Any]],
+    timeline_offset: int,
+    new_timeline: List[Dict[str, Any]],
+    summary: Optional[Dict[str, Any]] = None,
+) -> Optional[bool]:
+    """Insert new events/timeline entries as rows of the delta tables.
+
+    Rows are keyed by (run_id, seq) so a retried flush is ignored rather
+    than duplicated, and the story_runs row itself is never rewritten
+    except for the final summary.  Returns None when the delta tables are
+    not installed (see migrations/003) so callers can fall back.
+    """
+    global _delta_tables_exist
+    if not await _ensure_table():
+        return False
+    if _delta_tables_exist is False:
+        return None
+    try:
+        writes = []
+        if new_events:
+            writes.append(_rest_write(
+                "POST", f"/{EVENTS_TABLE}",
+                _delta_rows(run_id, events_offset, new_events),
+                prefer="resolution=ignore-duplicates,return=minimal",
+            ))
+        if new_timeline:
+            writes.append(_rest_write(
+                "POST", f"/{TIMELINE_TABLE}",
+                _delta_rows(run_id, timeline_offset, new_timeline),
+                prefer="resolution=ignore-duplicates,return=minimal",
+            ))
+        if summary:
+            writes.append(_rest_write(
+                "PATCH", f"/{TABLE}", {"summary": summary},
+                params={"id": f"eq.{run_id}"},
+            ))
+        await asyncio.gather(*writes)
+        _delta_tables_exist = True
         return True
     except Exception as e:
-        if _check_table_error(e):
-            _table_exists = False
-            _log_table_missing()
-        else:
-            print(f"[Supabase] Error updating story run {run_id}: {e}")
+        if _delta_tables_exist is None and _check_table_error(e):
+            _delta_tables_exist = False
+            print(
+                "[Supabase] story_run_events / story_run_timeline not found — run "
+                "migrations/003_story_run_delta_tables.sql. Falling back to JSONB appends."
+            )
+            return None
+        print(f"[Supabase] Error inserting rows for story run {run_id}: {e}")
         return False
 
 
+class PersistenceWorker:
+    """Background consumer that runs story-run writes off the streaming path.
+
+    Writers submit flush jobs to a bounded queue drained by one task, so a
+    slow Supabase round-trip overlaps with the next LLM call instead of
+    stalling the turn.  When the queue is full ``submit()`` waits —
+    back-pressure on the story loop rather than unbounded growth.
+    """
+
+    def __init__(self, maxsize: int = 32):
+        self.maxsize = maxsize
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def _ensure_started(self) -> asyncio.Queue:
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.maxsize)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return self._queue
+
+    async def submit(self, job: Callable[[], Awaitable[Any]]):
+        """Queue *job* (a no-arg coroutine function) for the background task."""
+        await self._ensure_started().put(job)
+
+    async def _run(self):
+        queue = self._queue
+        while True:
+            job = await queue.get()
+            try:
+                await job()
+            except Exception as e:
+                print(f"[Supabase] Background write failed: {e}")
+            finally:
+                queue.task_done()
+
+    async def drain(self):
+        """Wait until every queued job has run."""
+        if self._queue is not None and self._task is not None and not self._task.done():
+            await self._queue.join()
+
+
+_persistence = PersistenceWorker()
+
+
+async def drain_persistence():
+    """Wait for queued story-run writes to finish (call on shutdown)."""
+    await _persistence.drain()
+
+
+async def close_http():
+    """Close the pooled PostgREST client (call on shutdown, after draining)."""
+    global _http
+    if _http is not None:
+        http, _http = _http, None
+        await http.aclose()
+
+
+class StoryRunWriter:
+    """Coalesces a run's incremental saves into background delta writes.
+
+    ``update()`` only remembers the live events / timeline lists and queues
+    one flush on the shared ``PersistenceWorker`` if none is waiting, so
+    saves made while a write is queued or in flight collapse into the next
+    one.  Each flush sends only the entries added since the last one — as
+    delta-table rows, else as a JSONB append, else as a full update,
+    depending on which migrations are installed.
+    Call ``flush()`` once the story ends to write the remainder.
+    """
+
+    def __init__(self, run_id: str, worker: Optional[PersistenceWorker] = None):
+        self.run_id = run_id
+        self._worker = worker or _persistence
+        self._events: List[Dict[str, Any]] = []
+        self._timeline: List[Dict[str, Any]] = []
+        self._events_sent = 0
+        self._timeline_sent = 0
+        self._lock = asyncio.Lock()
+        self._queued = False
+
+    async def update(self, events: List[Dict[str, Any]], timeline: List[Dict[str, Any]]):
+        """Record the latest lists and queue a background flush if none is queued."""
+        self._events = events
+        self._timeline = timeline
+        if not self._queued:
+            self._queued = True
+            await self._worker.submit(self._queued_flush)
+
+    async def _queued_flush(self):
+        # Cleared before writing so updates made during the write queue
+        # another flush for whatever they add.
+        self._queued = False
+        await self._flush()
+
+    async def flush(self, summary: Optional[Dict[str, Any]] = None) -> bool:
+        """Write everything not yet persisted (plus *summary*) now.
+
+        Runs in the caller; a queued job still waiting behind it finds
+        nothing new and returns without a round-trip.
+        """
+        return await self._flush(summary)
+
+    async def _flush(self, summary: Optional[Dict[str, Any]] = None) -> bool:
+        async with self._lock:
+            # Snapshot the lengths before any await: the SSE loop keeps
+            # appending to these lists while the write is in flight.
+            events, timeline = self._events, self._timeline
+            n_ev, n_tl = len(events), len(timeline)
+            if self._events_sent > n_ev or self._timeline_sent > n_tl:
+                # Lists were replaced wholesale — resend everything
+                self._events_sent = self._timeline_sent = 0
+                result = None
+            else:
+                new_events = events[self._events_sent:n_ev]
+                new_timeline = timeline[self._timeline_sent:n_tl]
+                if not new_events and not new_timeline and not summary:
+                    return True
+                result = await append_story_run_rows(
+                    self.run_id,
+                    self._events_sent, new_events,
+                    self._timeline_sent, new_timeline,
+                    summary,
+                )
+                if result is None:
+                    result = await append_story_run(
+                        self.run_id, new_events, new_timeline, summary
+                    )
+            if result is None:
+                result = await update_story_run(
+                    self.run_id, events[:n_ev], timeline[:n_tl], summary
+                )
+            if result:
+                self._events_sent = n_ev
+                self._timeline_sent = n_tl
+            return result
+
+
 async def save_story_run(
     title: str,
     description: str,
@@ -150,13 +498,9 @@ async def save_story_run(
     summary: Dict[str, Any],
 ) -> Optional[str]:
     """Save a completed story run to Supabase. Returns the run ID."""
-    global _table_exists
-    if _table_exists is False:
+    if not await _ensure_table():
         return None
     try:
-        client = get_supabase()
-        if client is None:
-            return None
         data = {
             "title": title,
             "description": description,
@@ -165,92 +509,97 @@ async def save_story_run(
             "timeline": timeline,
             "summary": summary,
         }
-        result = client.table(TABLE).insert(data).execute()
-        _table_exists = True
-        if result.data:
-            run_id = result.data[0]["id"]
+        resp = await _rest_write(
+            "POST", f"/{TABLE}", data,
+            params={"select": "id"}, prefer="return=representation",
+        )
+        rows = resp.json()
+        if rows:
+            run_id = rows[0]["id"]
             print(f"[Supabase] Saved story run: {run_id}")
             return run_id
         return None
     except Exception as e:
-        if _check_table_error(e):
-            _table_exists = False
-            _log_table_missing()
-        else:
-            print(f"[Supabase] Error saving story run: {e}")
+        print(f"[Supabase] Error saving story run: {e}")
         return None
 
 
 async def list_story_runs(limit: int = 50) -> List[Dict[str, Any]]:
     """List recent story runs (without full events data for speed)."""
-    global _table_exists
-    if _table_exists is False:
+    if not await _ensure_table():
         return []
     try:
-        client = get_supabase()
-        if client is None:
-            return []
-        result = (
+        client = await get_supabase()
+        result = await (
             client.table(TABLE)
             .select("id, title, description, characters, summary, created_at")
             .order("created_at", desc=True)
             .limit(limit)
             .execute()
         )
-        _table_exists = True
         return result.data or []
     except Exception as e:
-        if _check_table_error(e):
-            _table_exists = False
-            _log_table_missing()
-        else:
-            print(f"[Supabase] Error listing story runs: {e}")
+        print(f"[Supabase] Error listing story runs: {e}")
         return []
 
 
+async def _get_run(run_id: str, select: Dict[str, str]) -> Optional[Dict[str, Any]]:
+    """One GET of a story_runs row by id; None if there is no such run."""
+    http = _get_http()
+    if http is None:
+        return None
+    resp = await http.get(
+        f"/{TABLE}", params={**select, "id": f"eq.{run_id}"}, headers=_SINGLE_OBJECT
+    )
+    if resp.status_code == 406:  # zero rows for object+json
+        return None
+    if resp.is_error:
+        raise RuntimeError(f"{resp.status_code}: {resp.text}")
+    return _loads(resp.content)
+
+
 async def get_story_run(run_id: str) -> Optional[Dict[str, Any]]:
-    """Get a single story run by ID with full data."""
-    global _table_exists
-    if _table_exists is False:
+    """Get a single story run by ID with full data.
+
+    The run and its delta-table rows come back from a single PostgREST
+    request (rows embedded via the run_id foreign keys).  Runs saved
+    through the delta tables have their events/timeline reassembled from
+    those rows; older runs keep the JSONB columns.
+    """
+    global _delta_tables_exist
+    if not await _ensure_table():
         return None
     try:
-        client = get_supabase()
-        if client is None:
-            return None
-        result = (
-            client.table(TABLE)
-            .select("*")
-            .eq("id", run_id)
-            .single()
-            .execute()
-        )
-        _table_exists = True
-        return result.data
+        if _delta_tables_exist is False:
+            return await _get_run(run_id, _RUN_SELECT)
+        try:
+            run = await _get_run(run_id, _RUN_WITH_ROWS_SELECT)
+        except RuntimeError as e:
+            if not _check_relationship_error(e):
+                raise
+            _delta_tables_exist = False
+            return await _get_run(run_id, _RUN_SELECT)
+        if run:
+            events = run.pop(EVENTS_TABLE, None)
+            timeline = run.pop(TIMELINE_TABLE, None)
+            if events:
+                run["events"] = [row["data"] for row in events]
+            if timeline:
+                run["timeline"] = [row["data"] for row in timeline]
+        return run
     except Exception as e:
-        if _check_table_error(e):
-            _table_exists = False
-            _log_table_missing()
-        else:
-            print(f"[Supabase] Error fetching story run {run_id}: {e}")
+        print(f"[Supabase] Error fetching story run {run_id}: {e}")
         return None
 
 
 async def delete_story_run(run_id: str) -> bool:
     """Delete a story run by ID."""
-    global _table_exists
-    if _table_exists is False:
+    if not await _ensure_table():
         return False
     try:
-        client = get_supabase()
-        if client is None:
-            return False
-        client.table(TABLE).delete().eq("id", run_id).execute()
+        await _rest_write("DELETE", f"/{TABLE}", None, params={"id": f"eq.{run_id}"})
         print(f"[Supabase] Deleted story run: {run_id}")
         return True
     except Exception as e:
-        if _check_table_error(e):
-            _table_exists = False
-            _log_table_missing()
-        else:
-            print(f"[Supabase] Error deleting story run {run_id}: {e}")
+        print(f"[Supabase] Error deleting story run {run_id}: {e}")
         return False